@@ -1,23 +1,24 @@
 from typing import Annotated, Any, cast
 
 from fastapi import Depends, HTTPException, Request
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.config import settings
 from ..core.db.database import async_get_db
 from ..core.exceptions.http_exceptions import ForbiddenException, RateLimitException, UnauthorizedException
 from ..core.logger import logging
+from ..core.permissions import PERMISSION_BITS, permissions_from_mask
 from ..core.security import TokenType, oauth2_scheme, verify_token
+from ..core.utils import cache as cache_utils
 from ..core.utils.rate_limit import rate_limiter
-from ..crud.crud_rate_limit import crud_rate_limits
-from ..crud.crud_tier import crud_tiers
 from ..crud.crud_users import crud_users
-from sqlalchemy import select
-from ..core.permissions import PermissionNames
-from ..models.permission_map import PermissionMap   
+from ..models.rate_limit import RateLimit
+from ..models.role import Role
+from ..models.tier import Tier
+from ..models.user_permission import UserPermission
 from ..models.user_role import UserRole
-from ..schemas.rate_limit import RateLimitRead, sanitize_path
-from ..schemas.tier import TierRead
+from ..schemas.rate_limit import sanitize_path
 
 logger = logging.getLogger(__name__)
 
@@ -38,10 +39,8 @@ async def get_current_user(
         user = await crud_users.get(db=db, username=token_data.username_or_email, is_deleted=False)
 
     if user:
-        if hasattr(user, 'model_dump'):
-            return user.model_dump()
-        else:
-            return user
+        # FastCRUD.get returns a dict unless return_as_model=True
+        return cast(dict[str, Any], user)
 
     raise UnauthorizedException("User not authenticated.")
 
@@ -56,10 +55,7 @@ async def get_optional_user(request: Request, db: AsyncSession = Depends(async_g
         if token_type.lower() != "bearer" or not token_value:
             return None
 
-        token_data = await verify_token(token_value, TokenType.ACCESS, db)
-        if token_data is None:
-            return None
-
+        # get_current_user verifies the token itself and raises 401 when it is invalid
         return await get_current_user(token_value, db=db)
 
     except HTTPException as http_exc:
@@ -91,36 +87,86 @@ async def has_permission(
 
     # 1) Direct user-level grant
     direct_q = await db.execute(
-        select(PermissionMap.id).where(
-            PermissionMap.user_id == user["id"],
-            PermissionMap.permission_name == permission_name,
+        select(UserPermission.permission_name).where(
+            UserPermission.user_id == user["id"],
+            UserPermission.permission_name == permission_name,
         )
     )
     if direct_q.scalar_one_or_none():
         return True
 
-    # 2) Role-level grant via UserRole association
-    role_q = await db.execute(
-        select(PermissionMap.id)
-        .join(UserRole, UserRole.role_id == PermissionMap.role_id)
-        .where(
-            UserRole.user_id == user["id"],
-            PermissionMap.permission_name == permission_name,
-        )
-    )
+    # 2) Role-level grant (several roles may grant the same permission)
+    role_ids = user.get("role_ids")
+    if role_ids is not None and not role_ids:
+        return False
+    bit = PERMISSION_BITS.get(permission_name)
+    if bit is None:
+        return False
+    # A single AND against role.permissions_mask, role_permission is not read
+    role_stmt = select(Role.id).where(Role.permissions_mask.op("&")(1 << bit) != 0)
+    if role_ids is not None:
+        # user.role_ids is already in the row, so user_role does not need to be joined
+        role_stmt = role_stmt.where(Role.id.in_(role_ids))
+    else:
+        role_stmt = role_stmt.join(UserRole, UserRole.role_id == Role.id).where(UserRole.user_id == user["id"])
+    role_q = await db.execute(role_stmt.limit(1))
     if role_q.scalar_one_or_none():
         return True
 
     return False
 
 
+# RBAC: all permission names granted to a user, directly or via roles, in one query
+async def get_user_permission_names(user_id: int, db: AsyncSession, role_ids: list[int] | None = None) -> set[str]:
+    direct = select(UserPermission.permission_name).where(UserPermission.user_id == user_id)
+    if role_ids is not None and not role_ids:
+        result = await db.execute(direct)
+        return set(result.scalars().all())
+
+    # OR of the roles' permission bitmasks, decoded in Python
+    roles_mask = select(func.bit_or(Role.permissions_mask))
+    if role_ids is not None:
+        # Denormalized user.role_ids from the already-loaded user row
+        roles_mask = roles_mask.where(Role.id.in_(role_ids))
+    else:
+        roles_mask = roles_mask.join(UserRole, UserRole.role_id == Role.id).where(UserRole.user_id == user_id)
+    direct_names = select(func.array_agg(UserPermission.permission_name)).where(UserPermission.user_id == user_id)
+    result = await db.execute(select(roles_mask.scalar_subquery(), direct_names.scalar_subquery()))
+    mask, names = result.one()
+    return set(names or ()) | permissions_from_mask(mask or 0)
+
+
+# RBAC: permission names served from Redis for PERMISSIONS_CACHE_EXPIRE seconds, database on a miss
+async def load_user_permission_names(user: dict, db: AsyncSession) -> frozenset[str]:
+    # No Redis cache client: always read the database
+    if cache_utils.client is None:
+        return frozenset(await get_user_permission_names(user["id"], db, user.get("role_ids")))
+
+    perms = await cache_utils.get_cached_permissions(user["id"])
+    if perms is None:
+        perms = frozenset(await get_user_permission_names(user["id"], db, user.get("role_ids")))
+        await cache_utils.set_cached_permissions(user["id"], perms, settings.PERMISSIONS_CACHE_EXPIRE)
+    return perms
+
+
 # RBAC: function-style dependency factory, consistent with existing project style
 def require_permission(permission_name: str):
     async def _checker(
+        request: Request,
         current_user: Annotated[dict, Depends(get_current_user)],
         db: Annotated[AsyncSession, Depends(async_get_db)],
     ) -> None:
-        allowed = await has_permission(current_user, permission_name, db)
+        # Without AuthorizationCacheMiddleware there is no cache, so fall back to a single lookup
+        cache = getattr(request.state, "auth_cache", None)
+        if cache is None:
+            allowed = await has_permission(current_user, permission_name, db)
+        elif current_user.get("is_superuser"):
+            allowed = True
+        else:
+            if cache["perms"] is None or cache["user_id"] != current_user["id"]:
+                cache["perms"] = await load_user_permission_names(current_user, db)
+                cache["user_id"] = current_user["id"]
+            allowed = permission_name in cache["perms"]
         if not allowed:
             raise ForbiddenException("You do not have enough privileges.")
     return _checker
@@ -135,16 +181,25 @@ async def rate_limiter_dependency(
     path = sanitize_path(request.url.path)
     if user:
         user_id = user["id"]
-        tier = await crud_tiers.get(db, id=user["tier_id"], schema_to_select=TierRead)
-        if tier:
-            tier = cast(TierRead, tier)
-            rate_limit = await crud_rate_limits.get(db=db, tier_id=tier.id, path=path, schema_to_select=RateLimitRead)
-            if rate_limit:
-                rate_limit = cast(RateLimitRead, rate_limit)
-                limit, period = rate_limit.limit, rate_limit.period
+        tier_id = user["tier_id"]
+        row = None
+        if tier_id is not None:
+            # Tier and its rate limit for this path in one round-trip on the request session
+            stmt = (
+                select(Tier.name, RateLimit.limit, RateLimit.period)
+                .outerjoin(RateLimit, (RateLimit.tier_id == Tier.id) & (RateLimit.path == path))
+                .where(Tier.id == tier_id)
+                .limit(1)
+            )
+            row = (await db.execute(stmt)).first()
+
+        if row is not None:
+            tier_name, rate_limit_limit, rate_limit_period = row
+            if rate_limit_limit is not None:
+                limit, period = rate_limit_limit, rate_limit_period
             else:
                 logger.warning(
-                    f"User {user_id} with tier '{tier.name}' has no specific rate limit for path '{path}'. \
+                    f"User {user_id} with tier '{tier_name}' has no specific rate limit for path '{path}'. \
                         Applying default rate limit."
                 )
                 limit, period = DEFAULT_LIMIT, DEFAULT_PERIOD
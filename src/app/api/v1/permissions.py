@@ -1,21 +1,43 @@
-from fastapi import APIRouter, Depends
+import hashlib
 from typing import Any, List
 
+import orjson
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
+
 from ..dependencies import require_permission
-from ...core.permissions import PermissionNames, permission_tree, flatten_permissions
+from ...core.permissions import FLAT_PERMISSIONS, PERMISSION_TREE, PermissionNames
 
-router = APIRouter(prefix="/permissions", tags=["permissions"])
+router = APIRouter(prefix="/permissions", tags=["permissions"], default_response_class=ORJSONResponse)
 
+# The permission registry is static, so both response bodies are serialized once at import time
+_FLAT_JSON: bytes = orjson.dumps(FLAT_PERMISSIONS)
+_TREE_JSON: bytes = orjson.dumps(PERMISSION_TREE)
+
+# Content only changes with a deploy, so a hash of the body is a stable validator
+_FLAT_ETAG = f'"{hashlib.blake2b(_FLAT_JSON, digest_size=16).hexdigest()}"'
+_TREE_ETAG = f'"{hashlib.blake2b(_TREE_JSON, digest_size=16).hexdigest()}"'
+_CACHE_CONTROL = "private, max-age=3600"
 
-@router.get("/", dependencies=[Depends(require_permission(PermissionNames.ROLE_READ))])
-async def read_permissions() -> List[str]:
-    """Retrieve all available permissions (flattened)."""
-    from ...core.permissions import permission_root
 
-    return flatten_permissions(permission_root)
+def _static_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """Return the cached body, or an empty 304 when the client already holds this version."""
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/", dependencies=[Depends(require_permission(PermissionNames.ROLE_READ))], response_model=List[str])
+async def read_permissions(request: Request) -> Response:
+    """Retrieve all available permissions (flattened)."""
+    return _static_json_response(request, _FLAT_JSON, _FLAT_ETAG)
 
 
-@router.get("/tree", dependencies=[Depends(require_permission(PermissionNames.ROLE_READ))])
-async def read_permissions_tree() -> Any:
+@router.get("/tree", dependencies=[Depends(require_permission(PermissionNames.ROLE_READ))], response_model=Any)
+async def read_permissions_tree(request: Request) -> Response:
     """Retrieve permissions as a tree structure for frontend display."""
-    return permission_tree()
\ No newline at end of file
+    return _static_json_response(request, _TREE_JSON, _TREE_ETAG)
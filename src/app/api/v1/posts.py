@@ -77,6 +77,9 @@ async def read_posts(
         db=db,
         offset=compute_offset(page, items_per_page),
         limit=items_per_page,
+        # Newest first, read in index order from ix_post_user_time without a sort step
+        sort_columns="created_at",
+        sort_orders="desc",
         created_by_user_id=db_user.id,
         is_deleted=False,
     )
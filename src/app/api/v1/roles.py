@@ -1,62 +1,102 @@
-from typing import Annotated, cast, List, Any
+from datetime import UTC, datetime
+from typing import Annotated, cast, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
 
 from ...api.dependencies import require_permission
 from ...core.decorators.unit_of_work import transactional
-from ...core.permissions import PermissionNames, flatten_permissions, permission_root
+from ...core.permissions import ALLOWED_PERMISSIONS, PermissionNames, permission_mask
+from ...core.db.after_commit import run_after_commit
 from ...core.db.database import async_get_db
 from ...crud.crud_roles import crud_roles
-from ...models.permission_map import PermissionMap
-from ...crud.crud_permission_maps import assign_permissions_to_role
+from ...models.role_permission import RolePermission
+from ...models.role import Role
+from ...models.user import User
+from ...models.user_role import UserRole
+from ...crud.crud_role_permissions import assign_permissions_to_role
 from ...core.exceptions.http_exceptions import NotFoundException
+from ...core.schemas import CursorPaginatedListResponse
+from ...core.utils.cache import invalidate_cached_permissions
 from ...schemas.role import (
     RoleCreate,
-    RoleCreateInternal,
     RoleRead,
     RoleUpdate,
     RoleUpdateInternal,
     RolePermissionsAssign,
+    RolePermissionsRead,
 )
 
-router = APIRouter(prefix="/role", tags=["roles"])
+router = APIRouter(prefix="/role", tags=["roles"], default_response_class=ORJSONResponse)
 
 
 @router.post("/", dependencies=[Depends(require_permission(PermissionNames.ROLE_CREATE))], response_model=RoleRead, status_code=201)
 @transactional()
 async def create_role(
     request: Request, role_in: RoleCreate, db: Annotated[AsyncSession, Depends(async_get_db)]
-) -> RoleRead:
-    # Check duplicate name
-    existing = await crud_roles.exists(db=db, name=role_in.name)
-    if existing:
+) -> Role:
+    # Validate permission names before writing anything
+    permission_names = list(dict.fromkeys(role_in.permission_names or []))
+    unknown = [name for name in permission_names if name not in ALLOWED_PERMISSIONS]
+    if unknown:
+        raise NotFoundException(f"Permission not found: {', '.join(unknown)}")
+
+    # The unique constraint on role.name rejects duplicates; RETURNING avoids a re-fetch
+    stmt = (
+        insert(Role)
+        .values(**role_in.model_dump(exclude={"permission_names"}), permissions_mask=permission_mask(permission_names))
+        .returning(Role)
+    )
+    try:
+        created = (await db.execute(stmt)).scalar_one()
+    except IntegrityError:
         raise HTTPException(status_code=400, detail="The role with this name already exists in the system.")
 
-    # Create role (transaction managed by decorator)
-    created = await crud_roles.create(db=db, object=RoleCreateInternal(**role_in.model_dump()), commit=False)
-    role_read = await crud_roles.get(db=db, id=created.id, schema_to_select=RoleRead)
-    if role_read is None:
-        raise HTTPException(status_code=404, detail="Created role not found")
-    role_read = cast(RoleRead, role_read)
+    # Grant all initial permissions with one multi-row INSERT
+    if permission_names:
+        await db.execute(
+            insert(RolePermission),
+            [{"role_id": created.id, "permission_name": name} for name in permission_names],
+        )
 
-    # Simplified: do not handle permissions here
-    return role_read
+    return created
 
 
-@router.get("/", dependencies=[Depends(require_permission(PermissionNames.ROLE_READ))], response_model=List[RoleRead])
-async def list_roles(request: Request, db: Annotated[AsyncSession, Depends(async_get_db)]) -> List[RoleRead]:
-    data = await crud_roles.get_multi(db=db)
-    return cast(List[RoleRead], data["data"])
+@router.get("/", dependencies=[Depends(require_permission(PermissionNames.ROLE_READ))], response_model=CursorPaginatedListResponse[RoleRead])
+async def list_roles(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(async_get_db)],
+    after_id: int | None = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 10,
+) -> dict[str, Any]:
+    # Keyset pagination on the primary key instead of returning every role
+    data: dict[str, Any] = await crud_roles.get_multi_by_cursor(
+        db=db, cursor=after_id, limit=limit, schema_to_select=RoleRead, sort_column="id"
+    )
+    return data
 
 
-@router.get("/{role_id}", dependencies=[Depends(require_permission(PermissionNames.ROLE_READ))], response_model=RoleRead)
-async def read_role(request: Request, role_id: int, db: Annotated[AsyncSession, Depends(async_get_db)]) -> RoleRead:
-    role = await crud_roles.get(db=db, id=role_id, schema_to_select=RoleRead)
+@router.get("/{role_id}", dependencies=[Depends(require_permission(PermissionNames.ROLE_READ))], response_model=RolePermissionsRead)
+async def read_role(
+    request: Request, role_id: int, db: Annotated[AsyncSession, Depends(async_get_db)]
+) -> dict[str, Any]:
+    # Role columns and its permission names in one round-trip
+    permissions_agg = func.array_agg(RolePermission.permission_name).filter(RolePermission.permission_name.is_not(None))
+    stmt = (
+        select(
+            Role.id, Role.name, Role.description, Role.is_active, Role.created_at, permissions_agg.label("permissions")
+        )
+        .outerjoin(RolePermission, RolePermission.role_id == Role.id)
+        .where(Role.id == role_id)
+        .group_by(Role.id)
+    )
+    role = (await db.execute(stmt)).mappings().one_or_none()
     if role is None:
         raise HTTPException(status_code=404, detail="Role not found")
-    return cast(RoleRead, role)
+    return {**role, "permissions": role["permissions"] or []}
 
 
 @router.put("/{role_id}/permissions", dependencies=[Depends(require_permission(PermissionNames.ROLE_UPDATE))])
@@ -79,14 +119,17 @@ async def grant_role_permissions(
 
     # Normalize and validate permission names
     incoming_names = perms_in.permission_names or []
-    allowed = set(flatten_permissions(permission_root))
-    for name in incoming_names:
-        if name not in allowed:
-            raise NotFoundException(f"Permission not found: {name}")
+    unknown = [name for name in incoming_names if name not in ALLOWED_PERMISSIONS]
+    if unknown:
+        raise NotFoundException(f"Permission not found: {', '.join(unknown)}")
 
     # Replace permissions
     await assign_permissions_to_role(db, role_id, incoming_names)
 
+    # Holders of the role must not keep serving the old permission set from Redis
+    holders = await db.execute(select(User.id).where(User.role_ids.contains([role_id])))
+    run_after_commit(db, invalidate_cached_permissions, *holders.scalars().all())
+
     return {"role_id": role_id, "permission_names": incoming_names}
 
 
@@ -94,24 +137,36 @@ async def grant_role_permissions(
 @transactional()
 async def update_role(
     request: Request, role_id: int, role_in: RoleUpdate, db: Annotated[AsyncSession, Depends(async_get_db)]
-) -> RoleRead:
+) -> dict[str, Any]:
     role = await crud_roles.get(db=db, id=role_id, schema_to_select=RoleRead)
     if role is None:
         raise HTTPException(status_code=404, detail="Role not found")
 
     # Duplicate name check
     if role_in.name is not None:
-        existing = await crud_roles.get(db=db, name=role_in.name, schema_to_select=RoleRead)
-        if existing and cast(RoleRead, existing).id != cast(RoleRead, role).id:
+        duplicate_q = select(1).where(Role.name == role_in.name, Role.id != role_id).limit(1)
+        if (await db.execute(duplicate_q)).scalar() is not None:
             raise HTTPException(status_code=400, detail="The role with this name already exists in the system.")
 
-    # Update role (transaction managed by decorator)
-    await crud_roles.update(db=db, object=RoleUpdateInternal(**role_in.model_dump(exclude_unset=True), updated_at=None), id=role_id, commit=False)
-
-    updated = await crud_roles.get(db=db, id=role_id, schema_to_select=RoleRead)
-    if updated is None:
-        raise HTTPException(status_code=404, detail="Role not found after update")
-    return cast(RoleRead, updated)
+    # Permissions are stored in RolePermission, not on the role row
+    update_data = role_in.model_dump(exclude_unset=True, exclude={"permission_names"})
+    if role_in.permission_names is not None:
+        unknown = [name for name in role_in.permission_names if name not in ALLOWED_PERMISSIONS]
+        if unknown:
+            raise NotFoundException(f"Permission not found: {', '.join(unknown)}")
+        await assign_permissions_to_role(db, role_id, role_in.permission_names)
+        holders = await db.execute(select(User.id).where(User.role_ids.contains([role_id])))
+        run_after_commit(db, invalidate_cached_permissions, *holders.scalars().all())
+
+    # Update role (transaction managed by decorator), RETURNING avoids a re-fetch
+    updated = await crud_roles.update(
+        db=db,
+        object=RoleUpdateInternal(**update_data, updated_at=datetime.now(UTC)),
+        id=role_id,
+        return_columns=list(RoleRead.model_fields),
+        commit=False,
+    )
+    return cast(dict[str, Any], updated)
 
 
 @router.delete("/{role_id}", dependencies=[Depends(require_permission(PermissionNames.ROLE_DELETE))])
@@ -122,17 +177,15 @@ async def delete_role(request: Request, role_id: int, db: Annotated[AsyncSession
         raise HTTPException(status_code=404, detail="Role not found")
 
     # Delete role's permissions and user-role links (transaction managed by decorator)
-    from ...models.user_role import UserRole
-
-    # Remove UserRole links
-    links = await db.execute(select(UserRole).where(UserRole.role_id == role_id))
-    for link in links.scalars().all():
-        await db.delete(link)
-
-    # Remove permissions (PermissionMap rows for this role)
-    perms_q = await db.execute(select(PermissionMap).where(PermissionMap.role_id == role_id))
-    for perm in perms_q.scalars().all():
-        await db.delete(perm)
+    await db.execute(delete(UserRole).where(UserRole.role_id == role_id))
+    holders = await db.execute(
+        update(User)
+        .where(User.role_ids.contains([role_id]))
+        .values(role_ids=func.array_remove(User.role_ids, role_id))
+        .returning(User.id)
+    )
+    run_after_commit(db, invalidate_cached_permissions, *holders.scalars().all())
+    await db.execute(delete(RolePermission).where(RolePermission.role_id == role_id))
 
     # Delete role
     await crud_roles.db_delete(db=db, id=role_id, commit=False)
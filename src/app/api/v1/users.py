@@ -1,24 +1,30 @@
 from typing import Annotated, Any, cast
 
-from fastapi import APIRouter, Depends, Request
-from fastcrud.paginated import PaginatedListResponse, compute_offset, paginated_response
+import anyio
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...api.dependencies import get_current_superuser, get_current_user, require_permission
 from ...core.decorators.unit_of_work import transactional
 from ...core.permissions import PermissionNames
+from ...core.db.after_commit import run_after_commit
 from ...core.db.database import async_get_db
+from ...core.schemas import CursorPaginatedListResponse
 from ...core.exceptions.http_exceptions import DuplicateValueException, NotFoundException
 from ...core.security import blacklist_token, get_password_hash, oauth2_scheme
+from ...core.utils.cache import invalidate_cached_permissions
 from ...crud.crud_rate_limit import crud_rate_limits
 from ...crud.crud_tier import crud_tiers
-from ...crud.crud_users import crud_users
-from ...crud.crud_roles import crud_roles
+from ...crud.crud_users import crud_users, get_taken_user_fields
 from ...crud.crud_user_roles import assign_role_to_user
+from ...models.role import Role
+from ...models.user import User
 from ...schemas.tier import TierRead
 from ...schemas.user import UserCreate, UserCreateInternal, UserRead, UserTierUpdate, UserUpdate, UserRolesAssign
 
-router = APIRouter(tags=["users"])
+router = APIRouter(tags=["users"], default_response_class=ORJSONResponse)
 
 # 当前路由仅允许具有 USER_CREATE 权限的用户访问
 # 仅处理用户模型相关字段（角色分配请使用专门接口）
@@ -26,45 +32,48 @@ router = APIRouter(tags=["users"])
 @transactional()
 async def write_user(
     request: Request, user: UserCreate, db: Annotated[AsyncSession, Depends(async_get_db)]
-) -> UserRead:
-    email_row = await crud_users.exists(db=db, email=user.email)
-    if email_row:
+) -> User:
+    taken = await get_taken_user_fields(db, email=user.email, username=user.username)
+    if "email" in taken:
         raise DuplicateValueException("Email is already registered")
-
-    username_row = await crud_users.exists(db=db, username=user.username)
-    if username_row:
+    if "username" in taken:
         raise DuplicateValueException("Username not available")
 
-    user_internal_dict = user.model_dump()
-    user_internal_dict["hashed_password"] = get_password_hash(password=user_internal_dict["password"])
-    del user_internal_dict["password"]
+    # bcrypt is CPU-bound, hash in a worker thread to keep the event loop responsive
+    hashed_password = await anyio.to_thread.run_sync(get_password_hash, user.password)
 
-    user_internal = UserCreateInternal(**user_internal_dict)
-    
-    # Create user (transaction managed by decorator)
-    created_user = await crud_users.create(db=db, object=user_internal, commit=False)
+    # Fields were already validated as UserCreate, skip a second validation pass
+    user_internal = UserCreateInternal.model_construct(
+        **user.model_dump(exclude={"password"}), hashed_password=hashed_password
+    )
 
-    # Fetch the created user with all data (outside transaction for read-only operation)
-    user_read = await crud_users.get(db=db, id=created_user.id, schema_to_select=UserRead)
-    if user_read is None:
-        raise NotFoundException("Created user not found")
+    # Create user (transaction managed by decorator)
+    # FastCRUD.create is untyped; it returns the ORM instance
+    created_user = cast(User, await crud_users.create(db=db, object=user_internal, commit=False))
 
-    return cast(UserRead, user_read)
+    # Flush to populate the generated id, the ORM object already holds every other column.
+    # response_model validates it once, no intermediate UserRead instance is built.
+    await db.flush()
+    return created_user
 
 
 
-@router.get("/users",dependencies=[Depends(require_permission(PermissionNames.USER_READ))], response_model=PaginatedListResponse[UserRead])
+@router.get("/users",dependencies=[Depends(require_permission(PermissionNames.USER_READ))], response_model=CursorPaginatedListResponse[UserRead])
 async def read_users(
-    request: Request, db: Annotated[AsyncSession, Depends(async_get_db)], page: int = 1, items_per_page: int = 10
+    request: Request,
+    db: Annotated[AsyncSession, Depends(async_get_db)],
+    after_id: int | None = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 10,
 ) -> dict:
-    users_data = await crud_users.get_multi(
+    # Keyset pagination: seeks past after_id on (is_deleted, id) instead of scanning an OFFSET
+    response: dict[str, Any] = await crud_users.get_multi_by_cursor(
         db=db,
-        offset=compute_offset(page, items_per_page),
-        limit=items_per_page,
+        cursor=after_id,
+        limit=limit,
+        schema_to_select=UserRead,
+        sort_column="id",
         is_deleted=False,
     )
-
-    response: dict[str, Any] = paginated_response(crud_data=users_data, page=page, items_per_page=items_per_page)
     return response
 
 
@@ -75,12 +84,14 @@ async def read_users_me(request: Request, current_user: Annotated[dict, Depends(
 
 
 @router.get("/user/{username}",dependencies=[Depends(require_permission(PermissionNames.USER_READ))], response_model=UserRead)
-async def read_user(request: Request, username: str, db: Annotated[AsyncSession, Depends(async_get_db)]) -> UserRead:
+async def read_user(
+    request: Request, username: str, db: Annotated[AsyncSession, Depends(async_get_db)]
+) -> dict[str, Any]:
     db_user = await crud_users.get(db=db, username=username, is_deleted=False, schema_to_select=UserRead)
     if db_user is None:
         raise NotFoundException("User not found")
 
-    return cast(UserRead, db_user)
+    return cast(dict[str, Any], db_user)
 
 
 
@@ -88,24 +99,26 @@ async def read_user(request: Request, username: str, db: Annotated[AsyncSession,
 @transactional()
 async def patch_user(
     user_id: int, values: UserUpdate, current_user: Annotated[dict, Depends(get_current_user)], db: Annotated[AsyncSession, Depends(async_get_db)]
-) -> UserRead:
-    user_current = await crud_users.get(db=db, id=user_id)
-    if not user_current:
+) -> dict[str, Any]:
+    db_user = await crud_users.get(db=db, id=user_id)
+    if not db_user:
         raise NotFoundException("User not found")
+    user_current = cast(dict[str, Any], db_user)
 
-    if values.username != user_current.username:
-        existing_username = await crud_users.exists(db=db, username=values.username)
-        if existing_username:
-            raise DuplicateValueException("Username not available")
-
-    if values.email != user_current.email:
-        existing_email = await crud_users.exists(db=db, email=values.email)
-        if existing_email:
-            raise DuplicateValueException("Email is already registered")
+    # Only values that actually change can collide; with none left the check issues no query
+    new_username = values.username if values.username != user_current["username"] else None
+    new_email = values.email if values.email != user_current["email"] else None
+    taken = await get_taken_user_fields(db, email=new_email, username=new_username, exclude_id=user_id)
+    if "username" in taken:
+        raise DuplicateValueException("Username not available")
+    if "email" in taken:
+        raise DuplicateValueException("Email is already registered")
 
-    # Update user (transaction managed by decorator)
-    updated_user = await crud_users.update(db=db, object=values, id=user_id, commit=False)
-    return cast(UserRead, updated_user)
+    # Update user (transaction managed by decorator), RETURNING avoids a re-fetch
+    updated_user = await crud_users.update(
+        db=db, object=values, id=user_id, return_columns=list(UserRead.model_fields), commit=False
+    )
+    return cast(dict[str, Any], updated_user)
 
 
 @router.delete("/user/{user_id}",dependencies=[Depends(require_permission(PermissionNames.USER_DELETE))])
@@ -223,7 +236,7 @@ async def grant_user_roles(
     """Replace a user's roles with the provided list.
 
     - Verifies the user exists
-    - Validates each role id exists
+    - Validates all role ids exist with a single query
     - Replaces all user roles in a single transaction
     """
     # Ensure user exists
@@ -235,12 +248,15 @@ async def grant_user_roles(
     role_ids = roles_in.role_ids or []
 
     # Validate roles
-    for rid in role_ids:
-        role = await crud_roles.get(db=db, id=rid)
-        if role is None:
-            raise NotFoundException(f"Role not found: {rid}")
+    if role_ids:
+        result = await db.execute(select(Role.id).where(Role.id.in_(role_ids)))
+        found = set(result.scalars().all())
+        missing = set(role_ids) - found
+        if missing:
+            raise NotFoundException(f"Role not found: {', '.join(str(rid) for rid in sorted(missing))}")
 
     # Replace user roles
     await assign_role_to_user(db, user_id, role_ids)
+    run_after_commit(db, invalidate_cached_permissions, user_id)
 
     return {"user_id": user_id, "role_ids": role_ids}
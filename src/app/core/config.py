@@ -5,7 +5,6 @@ from pydantic import SecretStr
 from pydantic_settings import BaseSettings
 from starlette.config import Config
 
-
 current_file_dir = os.path.dirname(os.path.realpath(__file__))
 env_path = os.path.join(current_file_dir, "..", "..", ".env")
 config = Config(env_path)
@@ -25,10 +24,16 @@ class CryptSettings(BaseSettings):
     ALGORITHM: str = config("ALGORITHM", default="HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = config("ACCESS_TOKEN_EXPIRE_MINUTES", default=30)
     REFRESH_TOKEN_EXPIRE_DAYS: int = config("REFRESH_TOKEN_EXPIRE_DAYS", default=7)
+    BCRYPT_ROUNDS: int = config("BCRYPT_ROUNDS", default=12)
 
 
 class DatabaseSettings(BaseSettings):
-    pass
+    DATABASE_POOL_SIZE: int = config("DATABASE_POOL_SIZE", default=20)
+    DATABASE_MAX_OVERFLOW: int = config("DATABASE_MAX_OVERFLOW", default=40)
+    DATABASE_POOL_TIMEOUT: int = config("DATABASE_POOL_TIMEOUT", default=10)
+    DATABASE_POOL_RECYCLE: int = config("DATABASE_POOL_RECYCLE", default=1800)
+    DATABASE_POOL_PRE_PING: bool = config("DATABASE_POOL_PRE_PING", default=True)
+    DATABASE_INSERTMANYVALUES_PAGE_SIZE: int = config("DATABASE_INSERTMANYVALUES_PAGE_SIZE", default=1000)
 
 
 class SQLiteSettings(DatabaseSettings):
@@ -77,12 +82,18 @@ class RedisCacheSettings(BaseSettings):
     REDIS_CACHE_URL: str = f"redis://{REDIS_CACHE_HOST}:{REDIS_CACHE_PORT}"
 
 
+class PermissionsCacheSettings(BaseSettings):
+    PERMISSIONS_CACHE_EXPIRE: int = config("PERMISSIONS_CACHE_EXPIRE", default=60)
+
+
 class ClientSideCacheSettings(BaseSettings):
     CLIENT_CACHE_MAX_AGE: int = config("CLIENT_CACHE_MAX_AGE", default=60)
 
 # CORS settings: no default allowed origins; empty list if not provided
 class CORSSettings(BaseSettings):
     CORS_ORIGINS_RAW: str | None = config("CORS_ORIGINS", default=None)
+    # Seconds browsers may cache a preflight response (Chromium caps this at 7200)
+    CORS_MAX_AGE: int = config("CORS_MAX_AGE", default=3600)
 
     @property
     def CORS_ORIGINS(self) -> list[str]:
@@ -148,6 +159,7 @@ class Settings(
     TestSettings,
     # RedisCacheSettings,
     ClientSideCacheSettings,
+    PermissionsCacheSettings,
     CORSSettings,
     # RedisQueueSettings,
     # RedisRateLimiterSettings,
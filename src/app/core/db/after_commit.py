@@ -0,0 +1,69 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+logger = logging.getLogger(__name__)
+
+_CALLBACKS_KEY = "after_commit_callbacks"
+
+# Strong references to running callbacks; the event loop only keeps weak ones
+_running: set[asyncio.Task[Any]] = set()
+
+
+def run_after_commit(db: AsyncSession, func: Callable[..., Awaitable[Any]], *args: Any) -> None:
+    """Run `func(*args)` once the session's current transaction has committed.
+
+    Use it for side effects that must not be seen before the data they describe, e.g.
+    cache invalidation: invalidating inside the transaction lets a concurrent request
+    re-cache the still-committed old rows. Callbacks queued inside a savepoint that is
+    rolled back, or in a transaction that is rolled back, are dropped.
+    """
+    sync_session = db.sync_session
+    transaction = sync_session.get_nested_transaction() or sync_session.get_transaction()
+    sync_session.info.setdefault(_CALLBACKS_KEY, []).append((transaction, func, args))
+
+
+def _within(transaction: SessionTransaction | None, ended: SessionTransaction) -> bool:
+    while transaction is not None:
+        if transaction is ended:
+            return True
+        transaction = transaction.parent
+    return False
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_rolled_back(session: Session, previous_transaction: SessionTransaction) -> None:
+    callbacks = session.info.get(_CALLBACKS_KEY)
+    if not callbacks:
+        return
+    if previous_transaction.parent is None:
+        # The whole transaction is gone, including callbacks queued before it began
+        del session.info[_CALLBACKS_KEY]
+    else:
+        callbacks[:] = [c for c in callbacks if not _within(c[0], previous_transaction)]
+
+
+@event.listens_for(Session, "after_commit")
+def _schedule_committed(session: Session) -> None:
+    callbacks = session.info.pop(_CALLBACKS_KEY, None)
+    if not callbacks:
+        return
+
+    # Commit events are synchronous; AsyncSession runs them on the event loop thread
+    loop = asyncio.get_running_loop()
+    for _, func, args in callbacks:
+        task = loop.create_task(func(*args))
+        _running.add(task)
+        task.add_done_callback(_finish)
+
+
+def _finish(task: asyncio.Task[Any]) -> None:
+    _running.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        # The transaction is already committed, so the failure can only be reported
+        logger.error("After-commit callback failed: %s", task.exception())
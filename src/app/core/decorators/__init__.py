@@ -2,6 +2,12 @@
 Core decorators for the FastAPI application.
 """
 
-from .unit_of_work import unit_of_work, transactional, read_only_transaction
+from .unit_of_work import (
+    unit_of_work,
+    transactional,
+    transactional_nested,
+    transactional_root,
+    read_only_transaction,
+)
 
-__all__ = ["unit_of_work", "transactional", "read_only_transaction"]
\ No newline at end of file
+__all__ = ["unit_of_work", "transactional", "transactional_nested", "transactional_root", "read_only_transaction"]
\ No newline at end of file
@@ -22,7 +22,8 @@ T = TypeVar('T')
 
 def unit_of_work(
     db_param_name: str = "db",
-    commit_on_success: bool = True
+    commit_on_success: bool = True,
+    nested: bool | None = None
 ):
     """
     工作单元装饰器，为路由函数自动管理数据库事务。
@@ -30,6 +31,9 @@ def unit_of_work(
     Args:
         db_param_name: 数据库会话参数的名称，默认为 "db"
         commit_on_success: 是否在成功时自动提交，默认为 True
+        nested: 事务方式。None（默认）时每次调用根据 in_transaction() 判断；
+            True 总是使用 savepoint（begin_nested）；False 总是开启新事务（begin），
+            显式指定时跳过每次调用的判断
     
     功能：
     - 自动开始事务
@@ -46,7 +50,52 @@ def unit_of_work(
             # 数据库事务都会自动回滚
             return user
     """
+    # 错误信息只依赖装饰器参数，预先构建
+    missing_session_msg = (
+        f"AsyncSession not found or invalid type for parameter '{db_param_name}'. "
+        "Ensure your route includes the dependency, e.g., "
+        f"`{db_param_name}: AsyncSession = Depends(async_get_db)`, or configure db_param_name correctly."
+    )
+
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        # 在装饰时解析一次参数位置，避免每次请求都调用 inspect.signature
+        db_index = -1
+        try:
+            # 沿 __wrapped__ 链找到原始函数，直接读取 code 对象中的位置参数名
+            code = getattr(inspect.unwrap(func), "__code__", None)
+            if code is not None:
+                param_names = code.co_varnames[: code.co_argcount]
+            else:
+                param_names = tuple(inspect.signature(func).parameters)
+            if db_param_name in param_names:
+                db_index = param_names.index(db_param_name)
+        except Exception as e:
+            logger.warning("Failed to inspect function signature: %s", e)
+
+        async def run_in_savepoint(db_session: AsyncSession, args: Any, kwargs: Any) -> T:
+            async with db_session.begin_nested() as savepoint:
+                try:
+                    # savepoint 会在 context manager 退出时自动提交
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    # 任何异常都回滚 savepoint
+                    await savepoint.rollback()
+                    logger.info("Savepoint rolled back due to exception: %s", e)
+                    raise
+
+        async def run_in_transaction(db_session: AsyncSession, args: Any, kwargs: Any) -> T:
+            async with db_session.begin():
+                try:
+                    # 事务会在 context manager 退出时自动提交
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    # 任何异常都回滚事务
+                    logger.info("Transaction rolled back due to exception: %s", e)
+                    raise
+
+        # 显式指定 nested 时在装饰时确定事务方式
+        run = run_in_savepoint if nested else run_in_transaction
+
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             # 获取数据库会话
@@ -55,55 +104,22 @@ def unit_of_work(
             # 从 kwargs 中查找数据库会话
             if db_param_name in kwargs:
                 db_session = kwargs[db_param_name]
-            else:
-                # 从 args 中查找（需要通过函数签名推断位置）
-                try:
-                    sig = inspect.signature(func)
-                    param_names = list(sig.parameters.keys())
-                    
-                    if db_param_name in param_names:
-                        param_index = param_names.index(db_param_name)
-                        if param_index < len(args):
-                            db_session = args[param_index]
-                except Exception as e:
-                    logger.warning(f"Failed to inspect function signature: {e}")
+            elif 0 <= db_index < len(args):
+                # 从 args 中查找（位置已在装饰时确定）
+                db_session = args[db_index]
             
             if not isinstance(db_session, AsyncSession):
-                msg = (
-                    f"AsyncSession not found or invalid type for parameter '{db_param_name}'. "
-                    "Ensure your route includes the dependency, e.g., "
-                    f"`{db_param_name}: AsyncSession = Depends(async_get_db)`, or configure db_param_name correctly."
-                )
+                msg = missing_session_msg
                 logger.error(msg)
                 # 未找到或类型无效时，抛出明确的配置错误
                 raise MissingDatabaseSessionError(msg)
             
-            # 检查是否已经在事务中
-            if db_session.in_transaction():
-                # 如果已经在事务中，使用 savepoint
-                async with db_session.begin_nested() as savepoint:
-                    try:
-                        result = await func(*args, **kwargs)
-                        if commit_on_success:
-                            # savepoint 会在 context manager 退出时自动提交
-                            pass
-                        return result
-                    except Exception as e:
-                        # 任何异常都回滚 savepoint
-                        await savepoint.rollback()
-                        logger.info(f"Savepoint rolled back due to exception: {str(e)}")
-                        raise
-            else:
-                # 开始新事务
-                async with db_session.begin():
-                    try:
-                        result = await func(*args, **kwargs)
-                        # 事务会在 context manager 退出时自动提交
-                        return result
-                    except Exception as e:
-                        # 任何异常都回滚事务
-                        logger.info(f"Transaction rolled back due to exception: {str(e)}")
-                        raise
+            if nested is None:
+                # 检查是否已经在事务中：已在事务中则使用 savepoint，否则开始新事务
+                if db_session.in_transaction():
+                    return await run_in_savepoint(db_session, args, kwargs)
+                return await run_in_transaction(db_session, args, kwargs)
+            return await run(db_session, args, kwargs)
         
         return wrapper
     return decorator
@@ -149,4 +165,36 @@ def read_only_transaction(db_param_name: str = "db"):
     return unit_of_work(
         db_param_name=db_param_name,
         commit_on_success=False
-    )
\ No newline at end of file
+    )
+
+
+def transactional_root(db_param_name: str = "db"):
+    """
+    顶层事务装饰器，总是通过 begin() 开启新事务，不做 in_transaction() 判断。
+
+    适用于确定会话上尚未开启事务的调用方。
+
+    Args:
+        db_param_name: 数据库会话参数的名称，默认为 "db"
+    """
+    return unit_of_work(
+        db_param_name=db_param_name,
+        commit_on_success=True,
+        nested=False
+    )
+
+
+def transactional_nested(db_param_name: str = "db"):
+    """
+    嵌套事务装饰器，总是通过 begin_nested() 使用 savepoint，不做 in_transaction() 判断。
+
+    适用于在外层事务中调用的服务函数。
+
+    Args:
+        db_param_name: 数据库会话参数的名称，默认为 "db"
+    """
+    return unit_of_work(
+        db_param_name=db_param_name,
+        commit_on_success=True,
+        nested=True
+    )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Dict, List
 
 
 class PermissionNames:
@@ -24,18 +25,18 @@ class PermissionNames:
     ROLE_DELETE = "role:delete"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PermissionNode:
     """Permission tree node used for frontend presentation and grouping.
 
     name: permission identifier string (from PermissionNames)
     display_name: human-friendly name for UI
-    children: nested permissions or groups
+    children: nested permissions or groups (immutable, the tree is static)
     """
 
     name: str
     display_name: str | None = None
-    children: List[PermissionNode] = field(default_factory=list)
+    children: tuple[PermissionNode, ...] = ()
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -49,30 +50,30 @@ class PermissionNode:
 permission_user_manage = PermissionNode(
     PermissionNames.USER_MANAGE,
     display_name="用户管理",
-    children=[
+    children=(
         PermissionNode(PermissionNames.USER_CREATE, display_name="创建用户"),
         PermissionNode(PermissionNames.USER_READ, display_name="查看用户"),
         PermissionNode(PermissionNames.USER_UPDATE, display_name="更新用户"),
         PermissionNode(PermissionNames.USER_DELETE, display_name="删除用户"),
-    ],
+    ),
 )
 
 permission_role_manage = PermissionNode(
     PermissionNames.ROLE_MANAGE,
     display_name="角色管理",
-    children=[
+    children=(
         PermissionNode(PermissionNames.ROLE_CREATE, display_name="创建角色"),
         PermissionNode(PermissionNames.ROLE_READ, display_name="查看角色"),
         PermissionNode(PermissionNames.ROLE_UPDATE, display_name="更新角色"),
         # Removed assign/revoke nodes per requirements
         PermissionNode(PermissionNames.ROLE_DELETE, display_name="删除角色"),
-    ],
+    ),
 )
 
 permission_root = PermissionNode(
     PermissionNames.ROOT,
     display_name="系统权限",
-    children=[permission_user_manage, permission_role_manage],
+    children=(permission_user_manage, permission_role_manage),
 )
 
 
@@ -81,16 +82,64 @@ permission_root = PermissionNode(
 def flatten_permissions(root: PermissionNode) -> List[str]:
     """Collect all permission names from the tree (preorder)."""
     names: List[str] = []
-
-    def _walk(node: PermissionNode) -> None:
+    stack = [root]
+    while stack:
+        node = stack.pop()
         names.append(node.name)
-        for child in node.children:
-            _walk(child)
-
-    _walk(root)
+        # Reversed so the leftmost child is visited first
+        stack.extend(reversed(node.children))
     return names
 
 
 def permission_tree() -> Dict[str, Any]:
-    """Return tree structure for frontend."""
-    return permission_root.to_dict()
\ No newline at end of file
+    """Return tree structure for frontend (shared precomputed dict, treat as read-only)."""
+    return PERMISSION_TREE
+
+
+# ----- Precomputed lookups -----
+# The tree is static process state, flatten it once at import time
+FLAT_PERMISSIONS: List[str] = flatten_permissions(permission_root)
+ALLOWED_PERMISSIONS: frozenset[str] = frozenset(FLAT_PERMISSIONS)
+PERMISSION_TREE: Dict[str, Any] = permission_root.to_dict()
+
+# ----- Permission bitmask -----
+# Bit index per permission for role.permissions_mask (BIGINT, so at most 63 bits).
+# Indexes are persisted in the database: append new permissions, never renumber or reuse a bit.
+PERMISSION_BITS: dict[str, int] = {
+    PermissionNames.ROOT: 0,
+    PermissionNames.USER_MANAGE: 1,
+    PermissionNames.USER_READ: 2,
+    PermissionNames.USER_CREATE: 3,
+    PermissionNames.USER_UPDATE: 4,
+    PermissionNames.USER_DELETE: 5,
+    PermissionNames.ROLE_MANAGE: 6,
+    PermissionNames.ROLE_READ: 7,
+    PermissionNames.ROLE_CREATE: 8,
+    PermissionNames.ROLE_UPDATE: 9,
+    PermissionNames.ROLE_DELETE: 10,
+}
+# Checked explicitly rather than with assert, which python -O strips: a permission without
+# a bit would silently never be granted through roles
+if set(PERMISSION_BITS) != ALLOWED_PERMISSIONS:
+    raise RuntimeError(
+        f"PERMISSION_BITS does not match the permission tree: "
+        f"missing {sorted(ALLOWED_PERMISSIONS - set(PERMISSION_BITS))}, "
+        f"unknown {sorted(set(PERMISSION_BITS) - ALLOWED_PERMISSIONS)}"
+    )
+if len(set(PERMISSION_BITS.values())) != len(PERMISSION_BITS):
+    raise RuntimeError("PERMISSION_BITS assigns the same bit to more than one permission")
+if max(PERMISSION_BITS.values()) >= 63:
+    raise RuntimeError("PERMISSION_BITS exceeds 63 bits, role.permissions_mask is a signed BIGINT")
+
+
+def permission_mask(names: Iterable[str]) -> int:
+    """Encode permission names as a bitmask."""
+    mask = 0
+    for name in names:
+        mask |= 1 << PERMISSION_BITS[name]
+    return mask
+
+
+def permissions_from_mask(mask: int) -> frozenset[str]:
+    """Decode a bitmask back into permission names."""
+    return frozenset(name for name, bit in PERMISSION_BITS.items() if mask >> bit & 1)
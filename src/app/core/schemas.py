@@ -1,11 +1,14 @@
 import uuid as uuid_pkg
 from uuid6 import uuid7
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, Field, field_serializer
 
 
+SchemaT = TypeVar("SchemaT")
+
+
 class HealthCheck(BaseModel):
     name: str
     version: str
@@ -48,6 +51,12 @@ class PersistentDeletion(BaseModel):
         return None
 
 
+# -------------- pagination --------------
+class CursorPaginatedListResponse(BaseModel, Generic[SchemaT]):
+    data: list[SchemaT]
+    next_cursor: int | None = None
+
+
 # -------------- token --------------
 class Token(BaseModel):
     access_token: str
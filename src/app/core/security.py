@@ -1,7 +1,9 @@
+from contextlib import nullcontext
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any, Literal, cast
 
+import anyio
 import bcrypt
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
@@ -15,6 +17,7 @@ from .schemas import TokenBlacklistCreate, TokenData
 
 SECRET_KEY: SecretStr = settings.SECRET_KEY
 ALGORITHM = settings.ALGORITHM
+BCRYPT_ROUNDS = settings.BCRYPT_ROUNDS
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 REFRESH_TOKEN_EXPIRE_DAYS = settings.REFRESH_TOKEN_EXPIRE_DAYS
 
@@ -27,12 +30,15 @@ class TokenType(str, Enum):
 
 
 async def verify_password(plain_password: str, hashed_password: str) -> bool:
-    correct_password: bool = bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    # bcrypt is CPU-bound, run it in a worker thread so it doesn't block the event loop
+    correct_password: bool = await anyio.to_thread.run_sync(
+        bcrypt.checkpw, plain_password.encode(), hashed_password.encode()
+    )
     return correct_password
 
 
 def get_password_hash(password: str) -> str:
-    hashed_password: str = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    hashed_password: str = bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
     return hashed_password
 
 
@@ -121,7 +127,8 @@ async def blacklist_tokens(access_token: str, refresh_token: str, db: AsyncSessi
     db: AsyncSession
         Database session for performing database operations.
     """
-    tx = db.begin_nested() if db.in_transaction() else db.begin()
+    # Join the caller's unit of work when there is one instead of paying for a SAVEPOINT
+    tx = nullcontext() if db.in_transaction() else db.begin()
 
     async with tx:
         for token in [access_token, refresh_token]:
@@ -133,7 +140,8 @@ async def blacklist_tokens(access_token: str, refresh_token: str, db: AsyncSessi
 
 
 async def blacklist_token(token: str, db: AsyncSession) -> None:
-    tx = db.begin_nested() if db.in_transaction() else db.begin()
+    # Join the caller's unit of work when there is one instead of paying for a SAVEPOINT
+    tx = nullcontext() if db.in_transaction() else db.begin()
 
     async with tx:
         payload = jwt.decode(token, SECRET_KEY.get_secret_value(), algorithms=[ALGORITHM])
@@ -1,3 +1,5 @@
+import asyncio
+import re
 from collections.abc import AsyncGenerator, Callable
 from contextlib import _AsyncGeneratorContextManager, asynccontextmanager
 from typing import Any
@@ -9,13 +11,15 @@ import redis.asyncio as redis
 from arq import create_pool
 from arq.connections import RedisSettings
 from fastapi import APIRouter, Depends, FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse
 
 from ..api.dependencies import get_current_superuser
 from ..core.utils.rate_limit import rate_limiter
+from ..middleware.authorization_cache_middleware import AuthorizationCacheMiddleware
 from ..middleware.client_cache_middleware import ClientCacheMiddleware
+from ..middleware.fast_cors_middleware import FastCORSMiddleware
 from ..models import *  # noqa: F403
 from .config import (
     AppSettings,
@@ -72,6 +76,10 @@ async def close_redis_rate_limit_pool() -> None:
         await rate_limiter.client.aclose()  # type: ignore
 
 
+# '-' 和空格统一替换为 '_'，单次扫描完成
+_OPERATION_ID_SUB = re.compile(r"[- ]").sub
+
+
 def custom_generate_unique_id(route: APIRoute) -> str:
     """
     格式：{tag}_{function_name}
@@ -84,7 +92,7 @@ def custom_generate_unique_id(route: APIRoute) -> str:
     function_name = route.name
     
     # 3. 组合并清理
-    operation_id = f"{tag}_{function_name}".lower().replace('-', '_').replace(' ', '_')
+    operation_id = _OPERATION_ID_SUB("_", f"{tag}_{function_name}".lower())
     
     return operation_id
 
@@ -110,39 +118,44 @@ def lifespan_factory(
 
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncGenerator:
-        from asyncio import Event
-
-        initialization_complete = Event()
+        initialization_complete = asyncio.Event()
         app.state.initialization_complete = initialization_complete
 
         await set_threadpool_tokens()
 
         try:
+            # 各连接池与建表互不依赖，并发执行以缩短启动时间
+            startup_tasks = []
             if isinstance(settings, RedisCacheSettings):
-                await create_redis_cache_pool()
+                startup_tasks.append(create_redis_cache_pool())
 
             if isinstance(settings, RedisQueueSettings):
-                await create_redis_queue_pool()
+                startup_tasks.append(create_redis_queue_pool())
 
             if isinstance(settings, RedisRateLimiterSettings):
-                await create_redis_rate_limit_pool()
+                startup_tasks.append(create_redis_rate_limit_pool())
 
             if create_tables_on_start:
-                await create_tables()
+                startup_tasks.append(create_tables())
+
+            await asyncio.gather(*startup_tasks)
 
             initialization_complete.set()
 
             yield
 
         finally:
+            shutdown_tasks = []
             if isinstance(settings, RedisCacheSettings):
-                await close_redis_cache_pool()
+                shutdown_tasks.append(close_redis_cache_pool())
 
             if isinstance(settings, RedisQueueSettings):
-                await close_redis_queue_pool()
+                shutdown_tasks.append(close_redis_queue_pool())
 
             if isinstance(settings, RedisRateLimiterSettings):
-                await close_redis_rate_limit_pool()
+                shutdown_tasks.append(close_redis_rate_limit_pool())
+
+            await asyncio.gather(*shutdown_tasks)
 
     return lifespan
 
@@ -193,6 +206,7 @@ def create_application(
 
     **kwargs
         Additional keyword arguments passed directly to the FastAPI constructor.
+        `default_response_class` defaults to `ORJSONResponse` unless given here.
 
     Returns
     -------
@@ -221,8 +235,12 @@ def create_application(
     if lifespan is None:
         lifespan = lifespan_factory(settings, create_tables_on_start=create_tables_on_start)
 
+    # orjson 序列化作为全局默认响应类，调用方可通过 kwargs 覆盖
+    kwargs.setdefault("default_response_class", ORJSONResponse)
+
     application = FastAPI(lifespan=lifespan, generate_unique_id_function=custom_generate_unique_id, **kwargs)
     application.include_router(router)
+    application.add_middleware(AuthorizationCacheMiddleware)
 
     if isinstance(settings, ClientSideCacheSettings):
         application.add_middleware(ClientCacheMiddleware, max_age=settings.CLIENT_CACHE_MAX_AGE)
@@ -232,11 +250,12 @@ def create_application(
         origins = settings.CORS_ORIGINS
         if isinstance(origins, list) and origins:
             application.add_middleware(
-                CORSMiddleware,
+                FastCORSMiddleware,
                 allow_origins=origins,
                 allow_credentials=True,
                 allow_methods=["*"],
                 allow_headers=["*"],
+                max_age=settings.CORS_MAX_AGE,
             )
     if isinstance(settings, EnvironmentSettings):
         if settings.ENVIRONMENT != EnvironmentOption.PRODUCTION:
@@ -253,9 +272,14 @@ def create_application(
                 return get_redoc_html(openapi_url="/openapi.json", title="docs")
 
             @docs_router.get("/openapi.json", include_in_schema=False)
-            async def openapi() -> dict[str, Any]:
-                out: dict = get_openapi(title=application.title, version=application.version, routes=application.routes)
-                return out
+            async def openapi() -> ORJSONResponse:
+                # 路由在启动后不再变化，schema 只生成一次；若运行时增删路由，需要先清空 application.openapi_schema
+                if application.openapi_schema is None:
+                    application.openapi_schema = get_openapi(
+                        title=application.title, version=application.version, routes=application.routes
+                    )
+                # 直接返回响应，跳过 FastAPI 对整个 schema 字典的 jsonable_encoder 遍历
+                return ORJSONResponse(application.openapi_schema)
 
             application.include_router(docs_router)
 
@@ -335,3 +335,34 @@ def cache(
         return inner
 
     return wrapper
+
+
+def _permissions_key(user_id: int) -> str:
+    return f"user_permissions:{user_id}"
+
+
+async def get_cached_permissions(user_id: int) -> frozenset[str] | None:
+    """Return the cached permission names of a user, or None on a miss or without a Redis client."""
+    if client is None:
+        return None
+
+    cached = await client.get(_permissions_key(user_id))
+    if cached is None:
+        return None
+    return frozenset(json.loads(cached))
+
+
+async def set_cached_permissions(user_id: int, permissions: frozenset[str] | set[str], expiration: int) -> None:
+    """Store a user's permission names for `expiration` seconds."""
+    if client is None:
+        return
+
+    await client.set(_permissions_key(user_id), json.dumps(sorted(permissions)), ex=expiration)
+
+
+async def invalidate_cached_permissions(*user_ids: int) -> None:
+    """Drop the cached permission names of the given users."""
+    if client is None or not user_ids:
+        return
+
+    await client.delete(*(_permissions_key(user_id) for user_id in user_ids))
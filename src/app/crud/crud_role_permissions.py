@@ -0,0 +1,33 @@
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.permissions import permission_mask
+from ..models.role import Role
+from ..models.role_permission import RolePermission
+
+
+async def assign_permissions_to_role(db: AsyncSession, role_id: int, permission_names: list[str] | None) -> None:
+    """Replace all permissions for a role with the provided list.
+
+    - Removes the role's RolePermission rows that are not requested with a single bulk DELETE
+    - Adds the requested rows with a single bulk INSERT ... ON CONFLICT DO NOTHING,
+      so rows the role already has are skipped by the database
+    - Treats None or empty list as removing all permissions
+    - Rewrites role.permissions_mask to match
+    """
+    desired = set(permission_names or [])
+
+    stale = delete(RolePermission).where(RolePermission.role_id == role_id)
+    if desired:
+        stale = stale.where(RolePermission.permission_name.not_in(desired))
+    await db.execute(stale)
+
+    if desired:
+        await db.execute(
+            insert(RolePermission)
+            .values([{"role_id": role_id, "permission_name": name} for name in desired])
+            .on_conflict_do_nothing(index_elements=["role_id", "permission_name"])
+        )
+
+    await db.execute(update(Role).where(Role.id == role_id).values(permissions_mask=permission_mask(desired)))
@@ -1,16 +1,28 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.postgresql import insert
 
+from ..models.user import User
 from ..models.user_role import UserRole
 
 
 async def assign_role_to_user(db: AsyncSession, user_id: int, role_ids: list[int] | None) -> None:
-    # 删除用户的所有角色关联
-    links_q = await db.execute(select(UserRole).where(UserRole.user_id == user_id))
-    for link in links_q.scalars().all():
-        await db.delete(link)
-
     # 处理传入角色ID列表（None 或 空 列表不授予任何角色）
-    unique_role_ids = list(set(role_ids or []))
-    for rid in unique_role_ids:
-        db.add(UserRole(user_id=user_id, role_id=rid))
+    unique_role_ids = set(role_ids or [])
+
+    # 只删除不再需要的角色关联（单条 DELETE 语句），保留的关联不动
+    stale = delete(UserRole).where(UserRole.user_id == user_id)
+    if unique_role_ids:
+        stale = stale.where(UserRole.role_id.not_in(unique_role_ids))
+    await db.execute(stale)
+
+    if unique_role_ids:
+        # executemany 批量插入，created_at 由数据库默认值生成
+        # 已存在的关联由 (user_id, role_id) 主键冲突跳过，而不是抛出 IntegrityError
+        await db.execute(
+            insert(UserRole).on_conflict_do_nothing(index_elements=["user_id", "role_id"]),
+            [{"user_id": user_id, "role_id": rid} for rid in unique_role_ids],
+        )
+
+    # 同步 user.role_ids 反范式字段，鉴权时无需再查询 user_role
+    await db.execute(update(User).where(User.id == user_id).values(role_ids=sorted(unique_role_ids)))
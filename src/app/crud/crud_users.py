@@ -1,3 +1,6 @@
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from .custom_fastcrud import FastCRUDNoCommit
 
 from ..models.user import User
@@ -5,3 +8,34 @@ from ..schemas.user import UserCreateInternal, UserDelete, UserRead, UserUpdate,
 
 CRUDUser = FastCRUDNoCommit[User, UserCreateInternal, UserUpdate, UserUpdateInternal, UserDelete, UserRead]
 crud_users = CRUDUser(User)
+
+
+async def get_taken_user_fields(
+    db: AsyncSession, email: str | None = None, username: str | None = None, exclude_id: int | None = None
+) -> set[str]:
+    """Return which of the given unique fields ("email", "username") already belong to a live user.
+
+    Both values are checked in one round-trip that selects only the two columns.
+    Soft-deleted users are ignored, matching the partial unique indexes on both columns.
+    """
+    conditions = []
+    if email is not None:
+        conditions.append(User.email == email)
+    if username is not None:
+        conditions.append(User.username == username)
+    if not conditions:
+        return set()
+
+    stmt = select(User.email, User.username).where(or_(*conditions), User.is_deleted.is_(False))
+    if exclude_id is not None:
+        stmt = stmt.where(User.id != exclude_id)
+
+    # Both columns are unique among live users, so at most two rows can match
+    result = await db.execute(stmt.limit(2))
+    taken: set[str] = set()
+    for row_email, row_username in result.all():
+        if email is not None and row_email == email:
+            taken.add("email")
+        if username is not None and row_username == username:
+            taken.add("username")
+    return taken
@@ -10,18 +10,19 @@ DeleteT = TypeVar("DeleteT")
 ReadT = TypeVar("ReadT")
 
 class FastCRUDNoCommit(FastCRUD[ModelT, CreateT, UpdateT, UpdateInternalT, DeleteT, ReadT]):
-    async def create(self, *args, **kwargs):
+    # 普通 def 直接返回父类协程：调用方 await 的是 FastCRUD 的协程本身，不再多包一层协程帧
+    def create(self, *args, **kwargs):
         kwargs.setdefault("commit", False)
-        return await super().create(*args, **kwargs)
+        return super().create(*args, **kwargs)
 
-    async def update(self, *args, **kwargs):
+    def update(self, *args, **kwargs):
         kwargs.setdefault("commit", False)
-        return await super().update(*args, **kwargs)
+        return super().update(*args, **kwargs)
 
-    async def delete(self, *args, **kwargs):
+    def delete(self, *args, **kwargs):
         kwargs.setdefault("commit", False)
-        return await super().delete(*args, **kwargs)
+        return super().delete(*args, **kwargs)
 
-    async def db_delete(self, *args, **kwargs):
+    def db_delete(self, *args, **kwargs):
         kwargs.setdefault("commit", False)
-        return await super().db_delete(*args, **kwargs)
\ No newline at end of file
+        return super().db_delete(*args, **kwargs)
\ No newline at end of file
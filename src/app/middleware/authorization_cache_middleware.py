@@ -0,0 +1,44 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class AuthorizationCacheMiddleware:
+    """Middleware that attaches a per-request authorization cache to `request.state`.
+
+    Parameters
+    ----------
+    app: ASGIApp
+        The wrapped ASGI application.
+
+    Methods
+    -------
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        Initialise `request.state.auth_cache` and pass the request on.
+
+    Note
+    ----
+        - `require_permission` fills `auth_cache["perms"]` with the current user's permission
+        names on first use, so further permission checks in the same request skip the database.
+        - The cache lives only as long as the request; grants changed by the request itself are
+        not reflected in checks that already ran.
+        - Implemented as plain ASGI middleware: it only writes to the scope, so it avoids the
+        task and stream `BaseHTTPMiddleware` sets up around every request (docs routes included).
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Initialise the authorization cache and process the request.
+
+        Parameters
+        ----------
+        scope: Scope
+            The ASGI connection scope; `request.state` is backed by `scope["state"]`.
+        receive: Receive
+            The ASGI receive channel.
+        send: Send
+            The ASGI send channel.
+        """
+        if scope["type"] == "http":
+            scope.setdefault("state", {})["auth_cache"] = {"user_id": None, "perms": None}
+        await self.app(scope, receive, send)
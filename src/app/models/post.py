@@ -2,7 +2,7 @@ import uuid as uuid_pkg
 from datetime import UTC, datetime
 from uuid6 import uuid7
 
-from sqlalchemy import DateTime, ForeignKey, String, UUID
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, UUID, desc, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..core.db.database import Base
@@ -10,15 +10,25 @@ from ..core.db.database import Base
 
 class Post(Base):
     __tablename__ = "post"
+    __table_args__ = (
+        # User timelines: live posts of one author, newest first. Partial, so soft-deleted rows are skipped
+        Index(
+            "ix_post_user_time",
+            "created_by_user_id",
+            desc("created_at"),
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
-    id: Mapped[int] = mapped_column("id", autoincrement=True, nullable=False, unique=True, primary_key=True, init=False)
-    created_by_user_id: Mapped[int] = mapped_column(ForeignKey("user.id"), index=True)
+    id: Mapped[int] = mapped_column("id", autoincrement=True, nullable=False, primary_key=True, init=False)
+    created_by_user_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
     title: Mapped[str] = mapped_column(String(30))
-    text: Mapped[str] = mapped_column(String(63206))
+    # Length is enforced by the schemas; toast_tuple_target and lz4 compression are set in the migration
+    text: Mapped[str] = mapped_column(Text)
     uuid: Mapped[uuid_pkg.UUID] = mapped_column(UUID(as_uuid=True),default_factory=uuid7, unique=True)
     media_url: Mapped[str | None] = mapped_column(String, default=None)
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default_factory=lambda: datetime.now(UTC))
     updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
-    is_deleted: Mapped[bool] = mapped_column(default=False, index=True)
+    is_deleted: Mapped[bool] = mapped_column(default=False)
@@ -1,6 +1,6 @@
-from datetime import UTC, datetime
+from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String
+from sqlalchemy import BigInteger, Boolean, DateTime, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..core.db.database import Base
@@ -14,13 +14,17 @@ class Role(Base):
     description: Mapped[str | None] = mapped_column(String, default=None)
 
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    # Bits from core.permissions.PERMISSION_BITS, kept in sync with role_permission by the service layer
+    permissions_mask: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), init=False)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default_factory=lambda: datetime.now(UTC))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), init=False)
     updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
 
-    permission_maps: Mapped[list["PermissionMap"]] = relationship(
-        "PermissionMap",
-        lazy="selectin",
+    # No route reads grants through the ORM; load explicitly with selectinload() where needed
+    role_permissions: Mapped[list["RolePermission"]] = relationship(
+        "RolePermission",
+        lazy="raise_on_sql",
         init=False,
+        repr=False,
     )
     
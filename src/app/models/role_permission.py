@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..core.db.database import Base
+
+
+class RolePermission(Base):
+    __tablename__ = "role_permission"
+
+    # Grant to a role; the composite primary key covers per-role lookups and the join from user_role
+    role_id: Mapped[int] = mapped_column(ForeignKey("role.id"), primary_key=True)
+    permission_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), init=False)
@@ -2,8 +2,8 @@ from uuid6 import uuid7
 from datetime import UTC, datetime
 import uuid as uuid_pkg
 
-from sqlalchemy import DateTime, ForeignKey, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..core.db.database import Base
@@ -11,27 +11,40 @@ from ..core.db.database import Base
 
 class User(Base):
     __tablename__ = "user"
+    __table_args__ = (
+        # Keyset pagination filters on is_deleted and seeks on id
+        Index("ix_user_is_deleted_id", "is_deleted", "id"),
+        # role_ids @> ARRAY[:role_id] membership lookups
+        Index("ix_user_role_ids_gin", "role_ids", postgresql_using="gin"),
+        # Unique among live users only, so a soft-deleted account frees its username and email
+        Index("ix_user_username", "username", unique=True, postgresql_where=text("is_deleted = false")),
+        Index("ix_user_email", "email", unique=True, postgresql_where=text("is_deleted = false")),
+    )
 
     id: Mapped[int] = mapped_column(autoincrement=True, primary_key=True, init=False)
     
     name: Mapped[str] = mapped_column(String(30))
-    username: Mapped[str] = mapped_column(String(20), unique=True, index=True)
-    email: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    username: Mapped[str] = mapped_column(String(20))
+    email: Mapped[str] = mapped_column(String(50))
     hashed_password: Mapped[str] = mapped_column(String)
     phone_number: Mapped[str | None] = mapped_column(String(32), default=None)
     uuid: Mapped[uuid_pkg.UUID] = mapped_column(UUID(as_uuid=True), default_factory=uuid7, unique=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default_factory=lambda: datetime.now(UTC))
     updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
-    is_deleted: Mapped[bool] = mapped_column(default=False, index=True)
+    is_deleted: Mapped[bool] = mapped_column(default=False)
     is_superuser: Mapped[bool] = mapped_column(default=False)
 
     tier_id: Mapped[int | None] = mapped_column(ForeignKey("tier.id"), index=True, default=None, init=False)
+    # Denormalized copy of user_role for the auth path; user_role stays the source of truth
+    role_ids: Mapped[list[int]] = mapped_column(ARRAY(Integer), server_default=text("'{}'"), init=False)
 
     # Relationships
+    # raise_on_sql: fetching a User must not pull its roles; use selectinload(User.roles) explicitly
     roles: Mapped[list["Role"]] = relationship(
         "Role",
         secondary="user_role",
-        lazy="selectin",
+        lazy="raise_on_sql",
         init=False,
+        repr=False,
     )
\ No newline at end of file
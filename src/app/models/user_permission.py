@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..core.db.database import Base
+
+
+class UserPermission(Base):
+    __tablename__ = "user_permission"
+
+    # Direct grant to a user; the composite primary key covers "does user X have permission Y"
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id"), primary_key=True)
+    permission_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), init=False)
@@ -25,7 +25,12 @@ class RateLimit(TimestampSchema, RateLimitBase):
     name: Annotated[str | None, Field(default=None, examples=["users:5:60"])]
 
 
-class RateLimitRead(RateLimitBase):
+class RateLimitRead(BaseModel):
+    # Flat rather than RateLimitBase: stored paths are already sanitized, and the inherited Python
+    # validator would otherwise run on the rate limiter's per-request lookup
+    path: Annotated[str, Field(examples=["users"])]
+    limit: Annotated[int, Field(examples=[5])]
+    period: Annotated[int, Field(examples=[60])]
     id: int
     tier_id: int
     name: str
@@ -0,0 +1,31 @@
+"""replace ix_rate_limit_tier_id with a covering (tier_id, path) index
+
+Revision ID: a4c2e8f1d3b5
+Revises: f2b7d9e4a6c1
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'a4c2e8f1d3b5'
+down_revision = 'f2b7d9e4a6c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Leading tier_id keeps serving tier-only lookups, so the single-column index is redundant
+    op.create_index(
+        'ix_rate_limit_tier_id_path',
+        'rate_limit',
+        ['tier_id', 'path'],
+        unique=False,
+        postgresql_include=['id', 'name', 'limit', 'period'],
+    )
+    op.drop_index('ix_rate_limit_tier_id', table_name='rate_limit')
+
+
+def downgrade() -> None:
+    op.create_index('ix_rate_limit_tier_id', 'rate_limit', ['tier_id'], unique=False)
+    op.drop_index('ix_rate_limit_tier_id_path', table_name='rate_limit')
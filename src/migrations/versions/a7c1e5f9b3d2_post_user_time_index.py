@@ -0,0 +1,33 @@
+"""replace the post author index with (created_by_user_id, created_at DESC) WHERE is_deleted = false
+
+Revision ID: a7c1e5f9b3d2
+Revises: f4b8d0e2a6c9
+Create Date: 2026-10-15
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'a7c1e5f9b3d2'
+down_revision = 'f4b8d0e2a6c9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Timeline reads walk this in order and stop at LIMIT, no sort step
+    op.create_index(
+        'ix_post_user_time',
+        'post',
+        ['created_by_user_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+    # A prefix of ix_post_user_time for live posts
+    op.drop_index('ix_post_created_by_user_id', table_name='post')
+
+
+def downgrade() -> None:
+    op.create_index('ix_post_created_by_user_id', 'post', ['created_by_user_id'], unique=False)
+    op.drop_index('ix_post_user_time', table_name='post')
@@ -0,0 +1,23 @@
+"""add composite index for user keyset pagination
+
+Revision ID: b7d2e41c9a63
+Revises: 4f0b8a12
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2e41c9a63'
+down_revision = '4f0b8a12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves `WHERE is_deleted = false AND id > :after_id ORDER BY id` without a sort
+    op.create_index('ix_user_is_deleted_id', 'user', ['is_deleted', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_is_deleted_id', table_name='user')
@@ -0,0 +1,26 @@
+"""drop boolean is_deleted indexes
+
+Revision ID: b8d1f5c3e7a9
+Revises: a4c2e8f1d3b5
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'b8d1f5c3e7a9'
+down_revision = 'a4c2e8f1d3b5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A two-valued column is never selective on its own; these only cost index writes
+    op.drop_index('ix_post_is_deleted', table_name='post')
+    # Redundant with the leading column of ix_user_is_deleted_id
+    op.drop_index('ix_user_is_deleted', table_name='user')
+
+
+def downgrade() -> None:
+    op.create_index('ix_user_is_deleted', 'user', ['is_deleted'], unique=False)
+    op.create_index('ix_post_is_deleted', 'post', ['is_deleted'], unique=False)
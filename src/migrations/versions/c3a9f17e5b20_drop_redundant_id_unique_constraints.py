@@ -0,0 +1,27 @@
+"""drop redundant unique constraints on primary key columns
+
+Revision ID: c3a9f17e5b20
+Revises: b7d2e41c9a63
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'c3a9f17e5b20'
+down_revision = 'b7d2e41c9a63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The primary key already enforces uniqueness; these second indexes only add write and cache cost
+    op.drop_constraint('tier_id_key', 'tier', type_='unique')
+    op.drop_constraint('rate_limit_id_key', 'rate_limit', type_='unique')
+    op.drop_constraint('post_id_key', 'post', type_='unique')
+
+
+def downgrade() -> None:
+    op.create_unique_constraint('post_id_key', 'post', ['id'])
+    op.create_unique_constraint('rate_limit_id_key', 'rate_limit', ['id'])
+    op.create_unique_constraint('tier_id_key', 'tier', ['id'])
@@ -0,0 +1,34 @@
+"""add denormalized user.role_ids with a GIN index
+
+Revision ID: c9e3a7b5d1f8
+Revises: b8d1f5c3e7a9
+Create Date: 2026-10-15
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'c9e3a7b5d1f8'
+down_revision = 'b8d1f5c3e7a9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'user',
+        sa.Column('role_ids', postgresql.ARRAY(sa.Integer()), server_default=sa.text("'{}'"), nullable=False),
+    )
+    # Backfill from user_role, which remains the source of truth
+    op.execute(
+        'UPDATE "user" u SET role_ids = '
+        'ARRAY(SELECT ur.role_id FROM user_role ur WHERE ur.user_id = u.id ORDER BY ur.role_id)'
+    )
+    op.create_index('ix_user_role_ids_gin', 'user', ['role_ids'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_role_ids_gin', table_name='user')
+    op.drop_column('user', 'role_ids')
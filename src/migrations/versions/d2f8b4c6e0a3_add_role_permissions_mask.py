@@ -0,0 +1,47 @@
+"""add role.permissions_mask bitmap
+
+Revision ID: d2f8b4c6e0a3
+Revises: c9e3a7b5d1f8
+Create Date: 2026-10-15
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'd2f8b4c6e0a3'
+down_revision = 'c9e3a7b5d1f8'
+branch_labels = None
+depends_on = None
+
+# Frozen copy of core.permissions.PERMISSION_BITS at this revision
+PERMISSION_BITS = {
+    'root': 0,
+    'user:manage': 1,
+    'user:read': 2,
+    'user:create': 3,
+    'user:update': 4,
+    'user:delete': 5,
+    'role:manage': 6,
+    'role:read': 7,
+    'role:create': 8,
+    'role:update': 9,
+    'role:delete': 10,
+}
+
+
+def upgrade() -> None:
+    op.add_column('role', sa.Column('permissions_mask', sa.BigInteger(), server_default=sa.text('0'), nullable=False))
+
+    # Backfill from role_permission; names without a bit contribute nothing
+    values = ', '.join(f"('{name}', {bit})" for name, bit in PERMISSION_BITS.items())
+    op.execute(
+        'UPDATE role r SET permissions_mask = COALESCE(('
+        'SELECT bit_or(1::bigint << b.bit) FROM role_permission rp '
+        f'JOIN (VALUES {values}) AS b(permission_name, bit) ON b.permission_name = rp.permission_name '
+        'WHERE rp.role_id = r.id), 0)'
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('role', 'permissions_mask')
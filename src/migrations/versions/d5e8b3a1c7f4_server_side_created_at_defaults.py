@@ -0,0 +1,27 @@
+"""generate created_at on the database side for tier, role, permission and user_role
+
+Revision ID: d5e8b3a1c7f4
+Revises: c3a9f17e5b20
+Create Date: 2026-10-15
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'd5e8b3a1c7f4'
+down_revision = 'c3a9f17e5b20'
+branch_labels = None
+depends_on = None
+
+TABLES = ('tier', 'role', 'permission', 'user_role')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'created_at', server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'created_at', server_default=None)
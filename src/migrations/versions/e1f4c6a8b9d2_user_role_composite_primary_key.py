@@ -0,0 +1,31 @@
+"""use (user_id, role_id) as the primary key of user_role
+
+Revision ID: e1f4c6a8b9d2
+Revises: d5e8b3a1c7f4
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'e1f4c6a8b9d2'
+down_revision = 'd5e8b3a1c7f4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The natural key replaces the surrogate id, its unique constraint and the user_id index
+    op.drop_constraint('uq_user_role', 'user_role', type_='unique')
+    op.drop_constraint('user_role_pkey', 'user_role', type_='primary')
+    op.drop_index('ix_user_role_user_id', table_name='user_role')
+    op.drop_column('user_role', 'id')
+    op.create_primary_key('user_role_pkey', 'user_role', ['user_id', 'role_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('user_role_pkey', 'user_role', type_='primary')
+    op.execute('ALTER TABLE user_role ADD COLUMN id SERIAL')
+    op.create_primary_key('user_role_pkey', 'user_role', ['id'])
+    op.create_index('ix_user_role_user_id', 'user_role', ['user_id'], unique=False)
+    op.create_unique_constraint('uq_user_role', 'user_role', ['user_id', 'role_id'])
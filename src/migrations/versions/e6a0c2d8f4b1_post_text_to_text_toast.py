@@ -0,0 +1,40 @@
+"""post.text: varchar(63206) -> text, TOAST bodies earlier
+
+Revision ID: e6a0c2d8f4b1
+Revises: d2f8b4c6e0a3
+Create Date: 2026-10-15
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'e6a0c2d8f4b1'
+down_revision = 'd2f8b4c6e0a3'
+branch_labels = None
+depends_on = None
+
+
+def _set_text_compression(method: str) -> None:
+    # Per-column compression exists from PostgreSQL 14; older servers keep pglz
+    op.execute(
+        "DO $$ BEGIN "
+        "IF current_setting('server_version_num')::int >= 140000 THEN "
+        f"EXECUTE 'ALTER TABLE post ALTER COLUMN text SET COMPRESSION {method}'; "
+        "END IF; END $$"
+    )
+
+
+def upgrade() -> None:
+    # varchar -> text is binary coercible, so no table rewrite
+    op.alter_column('post', 'text', existing_type=sa.String(length=63206), type_=sa.Text(), existing_nullable=False)
+    # Bodies above ~256 bytes go to TOAST, keeping heap pages dense for scans that skip text.
+    # Storage stays EXTENDED (compress, then move out of line); EXTERNAL would disable compression.
+    op.execute('ALTER TABLE post SET (toast_tuple_target = 256)')
+    _set_text_compression('lz4')
+
+
+def downgrade() -> None:
+    _set_text_compression('pglz')
+    op.execute('ALTER TABLE post RESET (toast_tuple_target)')
+    op.alter_column('post', 'text', existing_type=sa.Text(), type_=sa.String(length=63206), existing_nullable=False)
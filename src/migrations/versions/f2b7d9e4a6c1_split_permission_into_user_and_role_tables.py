@@ -0,0 +1,75 @@
+"""split permission into user_permission and role_permission
+
+Revision ID: f2b7d9e4a6c1
+Revises: e1f4c6a8b9d2
+Create Date: 2026-10-15
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'f2b7d9e4a6c1'
+down_revision = 'e1f4c6a8b9d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('user_permission',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('permission_name', sa.String(length=100), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'permission_name')
+    )
+    op.create_table('role_permission',
+    sa.Column('role_id', sa.Integer(), nullable=False),
+    sa.Column('permission_name', sa.String(length=100), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.ForeignKeyConstraint(['role_id'], ['role.id'], ),
+    sa.PrimaryKeyConstraint('role_id', 'permission_name')
+    )
+    op.execute(
+        'INSERT INTO user_permission (user_id, permission_name, created_at) '
+        'SELECT user_id, permission_name, created_at FROM permission WHERE user_id IS NOT NULL '
+        'ON CONFLICT DO NOTHING'
+    )
+    op.execute(
+        'INSERT INTO role_permission (role_id, permission_name, created_at) '
+        'SELECT role_id, permission_name, created_at FROM permission WHERE role_id IS NOT NULL '
+        'ON CONFLICT DO NOTHING'
+    )
+    op.drop_index('ix_permission_user_id', table_name='permission')
+    op.drop_index('ix_permission_role_id', table_name='permission')
+    op.drop_index('ix_permission_permission_name', table_name='permission')
+    op.drop_table('permission')
+
+
+def downgrade() -> None:
+    op.create_table('permission',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('permission_name', sa.String(length=100), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('role_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['role_id'], ['role.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('permission_name', 'role_id', name='uq_permission_role'),
+    sa.UniqueConstraint('permission_name', 'user_id', name='uq_permission_user')
+    )
+    op.create_index('ix_permission_permission_name', 'permission', ['permission_name'], unique=False)
+    op.create_index('ix_permission_role_id', 'permission', ['role_id'], unique=False)
+    op.create_index('ix_permission_user_id', 'permission', ['user_id'], unique=False)
+    op.execute(
+        'INSERT INTO permission (permission_name, user_id, created_at) '
+        'SELECT permission_name, user_id, created_at FROM user_permission'
+    )
+    op.execute(
+        'INSERT INTO permission (permission_name, role_id, created_at) '
+        'SELECT permission_name, role_id, created_at FROM role_permission'
+    )
+    op.drop_table('role_permission')
+    op.drop_table('user_permission')
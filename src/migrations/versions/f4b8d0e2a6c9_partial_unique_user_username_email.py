@@ -0,0 +1,31 @@
+"""make user username/email unique among live users only
+
+Revision ID: f4b8d0e2a6c9
+Revises: e6a0c2d8f4b1
+Create Date: 2026-10-15
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'f4b8d0e2a6c9'
+down_revision = 'e6a0c2d8f4b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Soft-deleted rows leave the unique btrees and no longer block reuse
+    for column in ('username', 'email'):
+        op.drop_index(f'ix_user_{column}', table_name='user')
+        op.create_index(
+            f'ix_user_{column}', 'user', [column], unique=True, postgresql_where=sa.text('is_deleted = false')
+        )
+
+
+def downgrade() -> None:
+    # Fails if a reused username/email now exists on both a live and a deleted row
+    for column in ('username', 'email'):
+        op.drop_index(f'ix_user_{column}', table_name='user')
+        op.create_index(f'ix_user_{column}', 'user', [column], unique=True)
@@ -3,11 +3,11 @@ import logging
 from uuid6 import uuid7 #126
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, MetaData, String, Table, insert, select
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, MetaData, String, Table, select
+from sqlalchemy.dialects.postgresql import UUID, insert
 
 from ..app.core.config import settings
-from ..app.core.db.database import AsyncSession, async_engine, local_session
+from ..app.core.db.database import AsyncSession, local_session
 from ..app.core.security import get_password_hash
 from ..app.models.user import User
 
@@ -20,21 +20,22 @@ async def create_first_user(session: AsyncSession) -> None:
         name = settings.ADMIN_NAME
         email = settings.ADMIN_EMAIL
         username = settings.ADMIN_USERNAME
-        hashed_password = get_password_hash(settings.ADMIN_PASSWORD)
 
-        query = select(User).filter_by(email=email)
-        result = await session.execute(query)
-        user = result.scalar_one_or_none()
+        # 查询与插入在同一个事务内完成，只取 id 列
+        async with session.begin():
+            result = await session.execute(select(User.id).filter_by(email=email, is_deleted=False).limit(1))
+            if result.scalar_one_or_none() is not None:
+                logger.info(f"Admin user {username} already exists.")
+                return
 
-        if user is None:
             metadata = MetaData()
             user_table = Table(
                 "user",
                 metadata,
                 Column("id", Integer, primary_key=True, autoincrement=True, nullable=False),
                 Column("name", String(30), nullable=False),
-                Column("username", String(20), nullable=False, unique=True, index=True),
-                Column("email", String(50), nullable=False, unique=True, index=True),
+                Column("username", String(20), nullable=False),
+                Column("email", String(50), nullable=False),
                 Column("hashed_password", String, nullable=False),
                 Column("profile_image_url", String, default="https://profileimageurl.com"),
                 Column("uuid", UUID(as_uuid=True), default=uuid7, unique=True),
@@ -50,17 +51,16 @@ async def create_first_user(session: AsyncSession) -> None:
                 "name": name,
                 "email": email,
                 "username": username,
-                "hashed_password": hashed_password,
+                "hashed_password": get_password_hash(settings.ADMIN_PASSWORD),
                 "is_superuser": True,
             }
 
-            stmt = insert(user_table).values(data)
-            async with async_engine.connect() as conn:
-                await conn.execute(stmt)
-                await conn.commit()
+            # 并发启动时忽略唯一约束冲突（不指定冲突目标，部分唯一索引同样生效）
+            stmt = insert(user_table).values(data).on_conflict_do_nothing()
+            inserted = await session.execute(stmt)
 
+        if inserted.rowcount:
             logger.info(f"Admin user {username} created successfully.")
-
         else:
             logger.info(f"Admin user {username} already exists.")
 
@@ -1,60 +1,202 @@
-from collections.abc import Callable, Generator
+import asyncio
+import importlib
+import os
+import pkgutil
+import sys
+from collections.abc import AsyncIterator, Callable, Generator
 from typing import Any
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
+import pytest_asyncio
 from faker import Faker
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.session import Session
-
-from src.app.core.config import settings
-from src.app.main import app
+from sqlalchemy.pool import NullPool
+from starlette.config import Config
+from uuid6 import uuid7
+
+# bcrypt cost 4 instead of the production 12 (~64x cheaper per hash); set before settings are imported.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+# The admin panel is not under test; keep it out of the client fixture's startup.
+os.environ.setdefault("CRUD_ADMIN_ENABLED", "False")
+
+# pytest -n auto: every xdist worker gets its own database (e.g. postgres_gw0) so workers never share rows.
+# Must run before the app settings are imported, they read POSTGRES_DB at import time.
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+if XDIST_WORKER:
+    _app_config = Config(os.path.join(os.path.dirname(__file__), "..", "src", ".env"))
+    os.environ["POSTGRES_DB"] = f"{_app_config('POSTGRES_DB', default='postgres')}_{XDIST_WORKER}"
+
+from src.app.core.config import settings  # noqa: E402
+from src.app.core.db.database import Base  # noqa: E402
+from src.app.core.security import get_password_hash  # noqa: E402
+from src.app.schemas.user import UserRead  # noqa: E402
+
+# The app is imported lazily, so register every model here, as migrations/env.py does;
+# mapper configuration and create_all need the full metadata.
+_models = importlib.import_module("src.app.models")
+for _, _module_name, _ in pkgutil.walk_packages(_models.__path__, _models.__name__ + "."):
+    importlib.import_module(_module_name)
 
 DATABASE_URI = settings.POSTGRES_URI
 DATABASE_PREFIX = settings.POSTGRES_SYNC_PREFIX
 
-sync_engine = create_engine(DATABASE_PREFIX + DATABASE_URI)
+# Sequential runs keep one warm pool; create_engine does not connect until first use.
+# Under xdist every worker would hold its own idle pool, so workers use NullPool instead and
+# pay one connect per test (the db fixture holds a single connection for the whole test).
+if XDIST_WORKER:
+    sync_engine = create_engine(DATABASE_PREFIX + DATABASE_URI, poolclass=NullPool)
+else:
+    sync_engine = create_engine(DATABASE_PREFIX + DATABASE_URI, pool_size=10, max_overflow=20, pool_recycle=3600)
 local_session = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop, like the ARQ worker; uvloop is not installed on Windows."""
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+
+    import uvloop
+
+    return uvloop.EventLoopPolicy()
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    # Runs whether or not the client fixture was used
+    sync_engine.dispose()
+
+
+# Tests only need a valid password, never a distinct one
+TEST_PASSWORD = "Str1ngst!"
+# The one bcrypt hash of TEST_PASSWORD every test and helper reuses
+TEST_PASSWORD_HASH = get_password_hash(TEST_PASSWORD)
+
 fake = Faker()
+# Fixed seed: fixture data is reproducible between runs, so a failure can be replayed
+fake.seed_instance(0)
 
 
 @pytest.fixture(scope="session")
 def client() -> Generator[TestClient, Any, None]:
+    # Imported here so mock-only test modules never assemble the FastAPI app
+    from src.app.main import app
+
     with TestClient(app) as _client:
         yield _client
     app.dependency_overrides = {}
-    sync_engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def worker_database() -> None:
+    """Create this xdist worker's database and tables on first use; a no-op without xdist."""
+    if not XDIST_WORKER:
+        return
+
+    maintenance_uri = DATABASE_URI.rsplit("/", 1)[0] + "/postgres"
+    admin_engine = create_engine(DATABASE_PREFIX + maintenance_uri, isolation_level="AUTOCOMMIT")
+    try:
+        with admin_engine.connect() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": settings.POSTGRES_DB}
+            ).scalar()
+            if not exists:
+                conn.exec_driver_sql(f'CREATE DATABASE "{settings.POSTGRES_DB}"')
+    finally:
+        admin_engine.dispose()
+    Base.metadata.create_all(sync_engine)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_engine(worker_database: None) -> AsyncIterator[AsyncEngine]:
+    """The app's async engine, warmed once and shared by every async test."""
+    from src.app.core.db.database import async_engine as engine
+
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def async_db(async_engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
 
 
 @pytest.fixture
-def db() -> Generator[Session, Any, None]:
-    session = local_session()
+def db(worker_database: None) -> Generator[Session, Any, None]:
+    # The test runs inside one outer transaction that is rolled back on teardown;
+    # session.commit() only releases a SAVEPOINT, so nothing reaches the WAL or leaks between tests
+    connection = sync_engine.connect()
+    transaction = connection.begin()
+    session = local_session(bind=connection, join_transaction_mode="create_savepoint")
     yield session
     session.close()
+    transaction.rollback()
+    connection.close()
 
 
 def override_dependency(dependency: Callable[..., Any], mocked_response: Any) -> None:
+    from src.app.main import app
+
     app.dependency_overrides[dependency] = lambda: mocked_response
 
 
+def _fake_transaction() -> AsyncMock:
+    tx = AsyncMock()
+    tx.__aenter__ = AsyncMock(return_value=tx)
+    tx.__aexit__ = AsyncMock(return_value=False)
+    return tx
+
+
+# Coroutine methods of AsyncSession that code under test awaits
+_ASYNC_SESSION_METHODS = (
+    "execute",
+    "scalar",
+    "scalars",
+    "get",
+    "flush",
+    "commit",
+    "rollback",
+    "refresh",
+    "delete",
+    "merge",
+    "close",
+)
+
+
+def build_async_db_mock(in_transaction: bool = False) -> MagicMock:
+    """AsyncSession mock whose begin() and begin_nested() work as async context managers.
+
+    A MagicMock specced on AsyncSession passes the decorators' isinstance check; only the
+    coroutine methods are swapped for AsyncMocks, which is cheaper than AsyncMock(spec=...)
+    inspecting every attribute.
+    """
+    session = MagicMock(spec=AsyncSession)
+    session.in_transaction.return_value = in_transaction
+    session.begin.return_value = _fake_transaction()
+    session.begin_nested.return_value = _fake_transaction()
+    # Instance attribute, not visible to the class spec
+    session.sync_session = MagicMock()
+    for name in _ASYNC_SESSION_METHODS:
+        setattr(session, name, AsyncMock(name=name))
+    return session
+
+
 @pytest.fixture
 def mock_db():
     """Mock database session for unit tests."""
-    session = AsyncMock(spec=AsyncSession)
-    # Simulate not being already in a transaction
-    session.in_transaction = Mock(return_value=False)
-    # Provide async context manager behavior for begin()
-    session.begin.return_value.__aenter__ = AsyncMock()
-    session.begin.return_value.__aexit__ = AsyncMock()
-    # Provide async context manager behavior for begin_nested() just in case
-    session.begin_nested.return_value.__aenter__ = AsyncMock()
-    session.begin_nested.return_value.__aexit__ = AsyncMock()
-    return session
+    return build_async_db_mock()
+
+
+@pytest.fixture
+def mock_db_with_tx():
+    """Mock session outside a transaction, plus the transaction its begin() enters."""
+    mock_db = build_async_db_mock()
+    return mock_db, mock_db.begin.return_value
 
 
 @pytest.fixture
@@ -67,24 +209,20 @@ def mock_redis():
     return mock_redis
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_user_data():
-    """Generate sample user data for tests."""
+    """Generate sample user data for tests (read-only, shared by the whole run)."""
     return {
         "name": fake.name(),
         "username": fake.user_name(),
         "email": fake.email(),
-        "password": fake.password(),
+        "password": TEST_PASSWORD,
     }
 
 
 @pytest.fixture
 def sample_user_read():
     """Generate a sample UserRead object."""
-    from uuid6 import uuid7
-
-    from src.app.schemas.user import UserRead
-
     return UserRead(
         id=1,
         uuid=uuid7(),
@@ -99,9 +237,9 @@ def sample_user_read():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def current_user_dict():
-    """Mock current user from auth dependency."""
+    """Mock current user from auth dependency (read-only, shared per module)."""
     return {
         "id": 1,
         "username": fake.user_name(),
@@ -1,25 +1,44 @@
-from uuid6 import uuid7 #126
+from datetime import UTC, datetime
 
+try:
+    # Rust-backed uuid7; the compat module returns stdlib uuid.UUID like uuid6 does
+    from uuid_utils.compat import uuid7
+except ImportError:
+    from uuid6 import uuid7  #126
+
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from src.app import models
-from src.app.core.security import get_password_hash
-from tests.conftest import fake
-
-
-def create_user(db: Session, is_super_user: bool = False) -> models.User:
-    _user = models.User(
-        name=fake.name(),
-        username=fake.user_name(),
-        email=fake.email(),
-        hashed_password=get_password_hash(fake.password()),
-        phone_number=fake.msisdn(),
-        uuid=uuid7(),
-        is_superuser=is_super_user,
-    )
-
-    db.add(_user)
-    db.commit()
-    db.refresh(_user)
-
-    return _user
+from tests.conftest import TEST_PASSWORD_HASH, fake
+
+
+def create_users(
+    db: Session, n: int, is_super_user: bool = False, hashed_password: str | None = None
+) -> list[models.User]:
+    """Insert n users with one multi-row INSERT ... RETURNING instead of a round-trip per user."""
+    if hashed_password is None:
+        hashed_password = TEST_PASSWORD_HASH
+
+    # uuid and created_at only have dataclass default factories, so bulk rows must carry them
+    now = datetime.now(UTC)
+    rows = [
+        {
+            "name": fake.name(),
+            "username": fake.unique.user_name(),
+            "email": fake.unique.email(),
+            "hashed_password": hashed_password,
+            "phone_number": fake.msisdn(),
+            "uuid": uuid7(),
+            "created_at": now,
+            "is_superuser": is_super_user,
+        }
+        for _ in range(n)
+    ]
+    # Runs inside the db fixture's test transaction, which is rolled back on teardown
+    result = db.scalars(insert(models.User).returning(models.User), rows)
+    return list(result.all())
+
+
+def create_user(db: Session, is_super_user: bool = False, hashed_password: str | None = None) -> models.User:
+    return create_users(db, 1, is_super_user, hashed_password)[0]
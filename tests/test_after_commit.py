@@ -0,0 +1,74 @@
+"""Unit tests for after-commit callbacks on database sessions."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.app.core.db.after_commit import run_after_commit
+
+
+@pytest_asyncio.fixture
+async def session() -> AsyncIterator[AsyncSession]:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with AsyncSession(engine) as db:
+        yield db
+    await engine.dispose()
+
+
+async def _drain() -> None:
+    # Callbacks are scheduled as tasks when the commit event fires
+    await asyncio.sleep(0)
+
+
+class TestRunAfterCommit:
+    """Test that callbacks follow the outcome of the transaction they were queued in."""
+
+    @pytest.mark.asyncio
+    async def test_runs_after_commit(self, session):
+        """Test that a callback queued in a transaction runs once it commits, not before."""
+        callback = AsyncMock()
+
+        async with session.begin():
+            await session.execute(text("SELECT 1"))
+            run_after_commit(session, callback, 1, 2)
+            await _drain()
+            callback.assert_not_called()
+
+        await _drain()
+        callback.assert_awaited_once_with(1, 2)
+
+    @pytest.mark.asyncio
+    async def test_dropped_on_rollback(self, session):
+        """Test that a rolled back transaction discards its callbacks."""
+        callback = AsyncMock()
+
+        with pytest.raises(ValueError):
+            async with session.begin():
+                run_after_commit(session, callback)
+                raise ValueError("boom")
+
+        await session.commit()
+        await _drain()
+        callback.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_savepoint_rollback_drops_only_its_callbacks(self, session):
+        """Test that a rolled back savepoint keeps callbacks queued by the enclosing transaction."""
+        outer = AsyncMock()
+        inner = AsyncMock()
+
+        async with session.begin():
+            run_after_commit(session, outer)
+            with pytest.raises(ValueError):
+                async with session.begin_nested():
+                    run_after_commit(session, inner)
+                    raise ValueError("boom")
+
+        await _drain()
+        outer.assert_awaited_once_with()
+        inner.assert_not_called()
@@ -0,0 +1,47 @@
+"""Unit tests for the CORS middleware."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.app.middleware.fast_cors_middleware import FastCORSMiddleware
+
+ALLOWED = "https://app.example.com"
+
+
+@pytest.fixture(scope="module")
+def cors_client():
+    app = FastAPI()
+    app.add_middleware(FastCORSMiddleware, allow_origins=[ALLOWED, "https://admin.example.com"], allow_methods=["*"])
+
+    @app.get("/ping")
+    def ping() -> dict[str, str]:
+        return {"ping": "pong"}
+
+    return TestClient(app)
+
+
+class TestFastCORSMiddleware:
+    """Test origin checks against the configured origin set."""
+
+    def test_allowed_origin(self, cors_client):
+        """Test that a configured origin is echoed back."""
+        response = cors_client.get("/ping", headers={"Origin": ALLOWED})
+
+        assert response.headers["access-control-allow-origin"] == ALLOWED
+
+    def test_disallowed_origin(self, cors_client):
+        """Test that an unknown origin gets no CORS headers."""
+        response = cors_client.get("/ping", headers={"Origin": "https://evil.example.com"})
+
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_preflight(self, cors_client):
+        """Test that preflight requests are accepted only for configured origins."""
+        headers = {"Access-Control-Request-Method": "GET"}
+
+        allowed = cors_client.options("/ping", headers={**headers, "Origin": ALLOWED})
+        disallowed = cors_client.options("/ping", headers={**headers, "Origin": "https://evil.example.com"})
+
+        assert allowed.status_code == 200
+        assert disallowed.status_code == 400
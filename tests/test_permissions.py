@@ -0,0 +1,175 @@
+"""Unit tests for RBAC permission lookups and their cache."""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.app.api.dependencies import get_user_permission_names, has_permission, load_user_permission_names
+from src.app.core.config import settings
+from src.app.core.permissions import ALLOWED_PERMISSIONS, PermissionNames, permission_mask, permissions_from_mask
+from src.app.core.utils import cache as cache_utils
+
+
+class TestLoadUserPermissionNames:
+    """Test the Redis-backed permission name cache."""
+
+    @pytest.fixture
+    def user(self):
+        return {"id": 7, "is_superuser": False, "role_ids": [1, 2]}
+
+    @pytest.fixture
+    def redis_client(self):
+        client = AsyncMock()
+        client.get.return_value = None
+        with patch.object(cache_utils, "client", client):
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_database(self, mock_db, user, redis_client):
+        """Test that cached permission names are returned without a database lookup."""
+        redis_client.get.return_value = json.dumps(["post:read", "post:write"])
+
+        with patch("src.app.api.dependencies.get_user_permission_names") as mock_lookup:
+            perms = await load_user_permission_names(user, mock_db)
+
+        assert perms == frozenset({"post:read", "post:write"})
+        redis_client.get.assert_awaited_once_with("user_permissions:7")
+        mock_lookup.assert_not_called()
+        redis_client.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_reads_database_and_stores(self, mock_db, user, redis_client):
+        """Test that a miss loads from the database and caches the result for the configured TTL."""
+        with patch(
+            "src.app.api.dependencies.get_user_permission_names", AsyncMock(return_value={"post:read"})
+        ) as mock_lookup:
+            perms = await load_user_permission_names(user, mock_db)
+
+        assert perms == frozenset({"post:read"})
+        mock_lookup.assert_awaited_once_with(7, mock_db, [1, 2])
+        redis_client.set.assert_awaited_once_with(
+            "user_permissions:7", json.dumps(["post:read"]), ex=settings.PERMISSIONS_CACHE_EXPIRE
+        )
+
+    @pytest.mark.asyncio
+    async def test_no_client_reads_database(self, mock_db, user):
+        """Test that without a Redis cache client the database is read and nothing is cached."""
+        with (
+            patch.object(cache_utils, "client", None),
+            patch("src.app.api.dependencies.get_user_permission_names", AsyncMock(return_value={"post:read"})),
+            patch.object(cache_utils, "get_cached_permissions") as mock_get,
+            patch.object(cache_utils, "set_cached_permissions") as mock_set,
+        ):
+            perms = await load_user_permission_names(user, mock_db)
+
+        assert perms == frozenset({"post:read"})
+        mock_get.assert_not_called()
+        mock_set.assert_not_called()
+
+
+def _compiled(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _scalar_result(value):
+    return Mock(scalar_one_or_none=Mock(return_value=value))
+
+
+class TestPermissionMask:
+    """Test the permission bitmask stored on role.permissions_mask."""
+
+    def test_round_trip(self):
+        """Test that every subset of permissions decodes back to itself."""
+        names = sorted(ALLOWED_PERMISSIONS)
+        for subset in ([], names[:1], names[::2], names):
+            assert permissions_from_mask(permission_mask(subset)) == frozenset(subset)
+
+    def test_bits_are_distinct(self):
+        """Test that no two permissions share a bit."""
+        masks = [permission_mask([name]) for name in ALLOWED_PERMISSIONS]
+        assert len(set(masks)) == len(masks)
+        assert permission_mask(ALLOWED_PERMISSIONS) == sum(masks)
+
+    def test_unknown_name_is_rejected(self):
+        """Test that an unregistered permission cannot be encoded."""
+        with pytest.raises(KeyError):
+            permission_mask(["post:fly"])
+
+
+class TestHasPermission:
+    """Test the role-level permission check against the bitmask."""
+
+    @pytest.mark.asyncio
+    async def test_role_ids_filters_roles_directly(self, mock_db):
+        """Test that a loaded role_ids list is used instead of joining user_role."""
+        mock_db.execute.side_effect = [_scalar_result(None), _scalar_result(1)]
+        user = {"id": 7, "is_superuser": False, "role_ids": [1, 2]}
+
+        assert await has_permission(user, PermissionNames.ROLE_UPDATE, mock_db)
+
+        role_sql = _compiled(mock_db.execute.await_args_list[1].args[0])
+        assert "user_role" not in role_sql
+        assert "role.id IN" in role_sql
+        assert "permissions_mask &" in role_sql
+
+    @pytest.mark.asyncio
+    async def test_empty_role_ids_skips_role_query(self, mock_db):
+        """Test that a user without roles only gets the direct grant lookup."""
+        mock_db.execute.return_value = _scalar_result(None)
+        user = {"id": 7, "is_superuser": False, "role_ids": []}
+
+        assert not await has_permission(user, PermissionNames.ROLE_UPDATE, mock_db)
+        mock_db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_role_ids_joins_user_role(self, mock_db):
+        """Test that without role_ids on the user the roles are found through user_role."""
+        mock_db.execute.side_effect = [_scalar_result(None), _scalar_result(None)]
+        user = {"id": 7, "is_superuser": False}
+
+        assert not await has_permission(user, PermissionNames.ROLE_UPDATE, mock_db)
+
+        role_sql = _compiled(mock_db.execute.await_args_list[1].args[0])
+        assert "JOIN user_role" in role_sql
+
+    @pytest.mark.asyncio
+    async def test_direct_grant_short_circuits(self, mock_db):
+        """Test that a direct user grant is enough without reading roles."""
+        mock_db.execute.return_value = _scalar_result(PermissionNames.ROLE_UPDATE)
+        user = {"id": 7, "is_superuser": False, "role_ids": [1]}
+
+        assert await has_permission(user, PermissionNames.ROLE_UPDATE, mock_db)
+        mock_db.execute.assert_awaited_once()
+
+
+class TestGetUserPermissionNames:
+    """Test decoding of the aggregated role mask and direct grants."""
+
+    @pytest.mark.asyncio
+    async def test_no_roles_bit_or_null(self, mock_db):
+        """Test that bit_or over no rows (NULL) decodes to no role permissions."""
+        mock_db.execute.return_value = Mock(one=Mock(return_value=(None, None)))
+
+        assert await get_user_permission_names(7, mock_db) == set()
+
+    @pytest.mark.asyncio
+    async def test_mask_and_direct_grants_are_merged(self, mock_db):
+        """Test that role permissions from the mask are merged with direct grants."""
+        mask = permission_mask([PermissionNames.ROLE_READ, PermissionNames.USER_READ])
+        mock_db.execute.return_value = Mock(one=Mock(return_value=(mask, [PermissionNames.ROLE_UPDATE])))
+
+        names = await get_user_permission_names(7, mock_db, role_ids=[1])
+
+        assert names == {PermissionNames.ROLE_READ, PermissionNames.USER_READ, PermissionNames.ROLE_UPDATE}
+
+    @pytest.mark.asyncio
+    async def test_empty_role_ids_reads_direct_grants_only(self, mock_db):
+        """Test that a user without roles skips the mask aggregate."""
+        mock_db.execute.return_value = Mock(
+            scalars=Mock(return_value=Mock(all=Mock(return_value=[PermissionNames.USER_READ])))
+        )
+
+        assert await get_user_permission_names(7, mock_db, role_ids=[]) == {PermissionNames.USER_READ}
+        assert "bit_or" not in _compiled(mock_db.execute.await_args.args[0])
@@ -0,0 +1,53 @@
+"""Unit tests for role API endpoints."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.app.api.v1.roles import update_role
+from src.app.core.permissions import PermissionNames
+from src.app.core.utils.cache import invalidate_cached_permissions
+from src.app.schemas.role import RoleUpdate
+
+
+class TestUpdateRole:
+    """Test role update endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_update_role_permissions_invalidates_holders(self, mock_db):
+        """Test that replacing a role's permissions drops its holders' cached permissions after commit."""
+        role = {"id": 1, "name": "editor"}
+        mock_db.execute.return_value = Mock(scalars=Mock(return_value=Mock(all=Mock(return_value=[3, 4]))))
+
+        with (
+            patch("src.app.api.v1.roles.crud_roles") as mock_crud,
+            patch("src.app.api.v1.roles.assign_permissions_to_role", new_callable=AsyncMock) as mock_assign,
+            patch("src.app.api.v1.roles.run_after_commit") as mock_after_commit,
+        ):
+            mock_crud.get = AsyncMock(return_value=role)
+            mock_crud.update = AsyncMock(return_value=role)
+
+            result = await update_role(
+                Mock(), 1, RoleUpdate(permission_names=[PermissionNames.ROLE_UPDATE]), db=mock_db
+            )
+
+        assert result == role
+        mock_assign.assert_awaited_once_with(mock_db, 1, [PermissionNames.ROLE_UPDATE])
+        mock_after_commit.assert_called_once_with(mock_db, invalidate_cached_permissions, 3, 4)
+
+    @pytest.mark.asyncio
+    async def test_update_role_without_permissions_keeps_cache(self, mock_db):
+        """Test that a rename alone leaves the holders' cached permissions alone."""
+        role = {"id": 1, "name": "editor"}
+        mock_db.execute.return_value = Mock(scalar=Mock(return_value=None))
+
+        with (
+            patch("src.app.api.v1.roles.crud_roles") as mock_crud,
+            patch("src.app.api.v1.roles.run_after_commit") as mock_after_commit,
+        ):
+            mock_crud.get = AsyncMock(return_value=role)
+            mock_crud.update = AsyncMock(return_value=role)
+
+            await update_role(Mock(), 1, RoleUpdate(name="writer"), db=mock_db)
+
+        mock_after_commit.assert_not_called()
@@ -0,0 +1,64 @@
+"""
+测试事务回滚机制（需要可用的 PostgreSQL 数据库）
+"""
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.crud.crud_roles import crud_roles
+from src.app.crud.crud_user_roles import assign_role_to_user
+from src.app.crud.crud_users import crud_users
+from src.app.schemas.user import UserCreateInternal
+from tests.conftest import TEST_PASSWORD_HASH
+
+
+@pytest.mark.asyncio
+async def test_transaction_rollback_scenarios(async_db: AsyncSession) -> None:
+    """角色分配失败时整个事务回滚；正常事务完整提交"""
+    db = async_db
+
+    # 场景1: 用户创建过程中角色分配失败
+    user_data = UserCreateInternal(
+        name="Test User",
+        username="testtxuser",  # 使用符合正则表达式的用户名 (只包含小写字母和数字)
+        email="test_transaction@example.com",
+        hashed_password=TEST_PASSWORD_HASH,
+    )
+    with pytest.raises(IntegrityError):
+        async with db.begin():
+            created_user = await crud_users.create(db=db, object=user_data)
+            await db.flush()
+            # 不存在的角色ID触发外键约束错误
+            await assign_role_to_user(db, created_user.id, [99999])
+
+    # 用户应随事务一起回滚
+    async with db.begin():
+        assert not await crud_users.exists(db=db, username="testtxuser"), "transaction rollback left stale user"
+
+    # 场景2: 正常的事务提交
+    async with db.begin():
+        roles = await crud_roles.get_multi(db=db, limit=1)
+    if not roles["data"]:
+        pytest.skip("找不到测试用的角色")
+    role_id = roles["data"][0]["id"]
+
+    user_data2 = UserCreateInternal(
+        name="Test User 2",
+        username="testtxuser2",
+        email="test_transaction2@example.com",
+        hashed_password=TEST_PASSWORD_HASH,
+    )
+    async with db.begin():
+        created_user = await crud_users.create(db=db, object=user_data2)
+        await db.flush()
+        user_id = created_user.id
+        await assign_role_to_user(db, user_id, [role_id])
+
+    try:
+        async with db.begin():
+            assert await crud_users.exists(db=db, username="testtxuser2"), "committed user not found"
+    finally:
+        # 清理测试数据：先删除角色关联再物理删除用户
+        async with db.begin():
+            await assign_role_to_user(db, user_id, [])
+            await crud_users.db_delete(db=db, id=user_id)
@@ -7,12 +7,18 @@ the expected behavior for different scenarios.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.app.core.decorators.unit_of_work import transactional, unit_of_work, read_only_transaction
+from src.app.core.decorators.unit_of_work import (
+    read_only_transaction,
+    transactional,
+    transactional_nested,
+    transactional_root,
+    unit_of_work,
+)
+from tests.conftest import build_async_db_mock
 
 
 class TestTransactionalDecorator:
@@ -22,9 +28,7 @@ class TestTransactionalDecorator:
     async def test_transactional_success_commit(self):
         """Test that transactional decorator commits on successful execution."""
         # Mock database session
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_db.begin.return_value.__aenter__ = AsyncMock()
-        mock_db.begin.return_value.__aexit__ = AsyncMock()
+        mock_db = build_async_db_mock()
         
         @transactional()
         async def test_function(db: AsyncSession):
@@ -36,53 +40,11 @@ class TestTransactionalDecorator:
         assert result == "success"
         mock_db.begin.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_transactional_rollback_on_exception(self):
-        """Test that transactional decorator rolls back on exception."""
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_transaction = AsyncMock()
-        mock_db.begin.return_value = mock_transaction
-        mock_transaction.__aenter__ = AsyncMock(return_value=mock_transaction)
-        mock_transaction.__aexit__ = AsyncMock()
-        
-        @transactional()
-        async def test_function(db: AsyncSession):
-            raise ValueError("Test error")
-        
-        with pytest.raises(ValueError, match="Test error"):
-            await test_function(db=mock_db)
-        
-        mock_db.begin.assert_called_once()
-        # Verify transaction context was entered
-        mock_transaction.__aenter__.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_transactional_rollback_on_http_exception(self):
-        """Test that transactional decorator rolls back on HTTPException."""
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_transaction = AsyncMock()
-        mock_db.begin.return_value = mock_transaction
-        mock_transaction.__aenter__ = AsyncMock(return_value=mock_transaction)
-        mock_transaction.__aexit__ = AsyncMock()
-        
-        @transactional()
-        async def test_function(db: AsyncSession):
-            raise HTTPException(status_code=400, detail="Bad request")
-        
-        with pytest.raises(HTTPException):
-            await test_function(db=mock_db)
-        
-        mock_db.begin.assert_called_once()
-
     @pytest.mark.asyncio
     async def test_transactional_with_nested_transactions(self):
         """Test that transactional decorator handles nested transactions with savepoints."""
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_db.in_transaction.return_value = True
-        mock_savepoint = AsyncMock()
-        mock_db.begin_nested.return_value = mock_savepoint
-        mock_savepoint.__aenter__ = AsyncMock(return_value=mock_savepoint)
-        mock_savepoint.__aexit__ = AsyncMock()
+        mock_db = build_async_db_mock(in_transaction=True)
+        mock_savepoint = mock_db.begin_nested.return_value
         
         @transactional()
         async def test_function(db: AsyncSession):
@@ -101,9 +63,7 @@ class TestUnitOfWorkDecorator:
     @pytest.mark.asyncio
     async def test_unit_of_work_success(self):
         """Test that unit_of_work decorator works correctly for successful operations."""
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_db.begin.return_value.__aenter__ = AsyncMock()
-        mock_db.begin.return_value.__aexit__ = AsyncMock()
+        mock_db = build_async_db_mock()
         
         @unit_of_work()
         async def test_function(db: AsyncSession):
@@ -114,24 +74,6 @@ class TestUnitOfWorkDecorator:
         assert result == {"result": "success"}
         mock_db.begin.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_unit_of_work_with_sqlalchemy_error(self):
-        """Test that unit_of_work decorator handles SQLAlchemy errors properly."""
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_transaction = AsyncMock()
-        mock_db.begin.return_value = mock_transaction
-        mock_transaction.__aenter__ = AsyncMock(return_value=mock_transaction)
-        mock_transaction.__aexit__ = AsyncMock()
-        
-        @unit_of_work()
-        async def test_function(db: AsyncSession):
-            raise SQLAlchemyError("Database error")
-        
-        with pytest.raises(SQLAlchemyError, match="Database error"):
-            await test_function(db=mock_db)
-        
-        mock_db.begin.assert_called_once()
-
 
 class TestReadOnlyTransactionDecorator:
     """Test cases for the @read_only_transaction decorator."""
@@ -139,9 +81,7 @@ class TestReadOnlyTransactionDecorator:
     @pytest.mark.asyncio
     async def test_read_only_transaction_success(self):
         """Test that read_only_transaction decorator works for read operations."""
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_db.begin.return_value.__aenter__ = AsyncMock()
-        mock_db.begin.return_value.__aexit__ = AsyncMock()
+        mock_db = build_async_db_mock()
         
         @read_only_transaction()
         async def test_function(db: AsyncSession):
@@ -152,23 +92,43 @@ class TestReadOnlyTransactionDecorator:
         assert result == {"data": "read_result"}
         mock_db.begin.assert_called_once()
 
+
+class TestExplicitTransactionModeDecorators:
+    """Test cases for the @transactional_root and @transactional_nested decorators."""
+
     @pytest.mark.asyncio
-    async def test_read_only_transaction_rollback_on_exception(self):
-        """Test that read_only_transaction decorator rolls back on exception."""
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_transaction = AsyncMock()
-        mock_db.begin.return_value = mock_transaction
-        mock_transaction.__aenter__ = AsyncMock(return_value=mock_transaction)
-        mock_transaction.__aexit__ = AsyncMock()
+    async def test_transactional_root_uses_begin_without_checking(self):
+        """Test that transactional_root always begins a new transaction."""
+        mock_db = build_async_db_mock(in_transaction=True)
         
-        @read_only_transaction()
+        @transactional_root()
         async def test_function(db: AsyncSession):
-            raise Exception("Read operation failed")
+            return "root_success"
         
-        with pytest.raises(Exception, match="Read operation failed"):
-            await test_function(db=mock_db)
+        result = await test_function(db=mock_db)
         
+        assert result == "root_success"
         mock_db.begin.assert_called_once()
+        mock_db.begin_nested.assert_not_called()
+        mock_db.in_transaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_transactional_nested_uses_savepoint_without_checking(self):
+        """Test that transactional_nested always uses a savepoint, with db passed positionally."""
+        mock_db = build_async_db_mock()
+        mock_savepoint = mock_db.begin_nested.return_value
+        
+        @transactional_nested()
+        async def test_function(user_id: int, db: AsyncSession):
+            raise ValueError("Nested error")
+        
+        with pytest.raises(ValueError, match="Nested error"):
+            await test_function(1, mock_db)
+        
+        mock_db.begin_nested.assert_called_once()
+        mock_savepoint.rollback.assert_awaited_once()
+        mock_db.begin.assert_not_called()
+        mock_db.in_transaction.assert_not_called()
 
 
 class TestDecoratorIntegration:
@@ -188,9 +148,7 @@ class TestDecoratorIntegration:
     @pytest.mark.asyncio
     async def test_decorator_with_multiple_parameters(self):
         """Test that decorators work with functions having multiple parameters."""
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_db.begin.return_value.__aenter__ = AsyncMock()
-        mock_db.begin.return_value.__aexit__ = AsyncMock()
+        mock_db = build_async_db_mock()
         
         @transactional()
         async def multi_param_function(user_id: int, data: dict, db: AsyncSession):
@@ -201,23 +159,33 @@ class TestDecoratorIntegration:
         assert result == {"user_id": 1, "data": {"name": "test"}}
         mock_db.begin.assert_called_once()
 
+
+class TestRollbackOnException:
+    """Every decorator leaves its transaction and re-raises the original exception."""
+
     @pytest.mark.asyncio
-    async def test_decorator_error_handling_preserves_original_exception(self):
-        """Test that decorators preserve the original exception details."""
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_transaction = AsyncMock()
-        mock_db.begin.return_value = mock_transaction
-        mock_transaction.__aenter__ = AsyncMock(return_value=mock_transaction)
-        mock_transaction.__aexit__ = AsyncMock()
-        
-        original_error = ValueError("Original error message")
-        
-        @transactional()
-        async def error_function(db: AsyncSession):
-            raise original_error
-        
-        with pytest.raises(ValueError) as exc_info:
-            await error_function(db=mock_db)
-        
-        assert exc_info.value is original_error
-        assert str(exc_info.value) == "Original error message"
\ No newline at end of file
+    @pytest.mark.parametrize("decorator", [transactional, unit_of_work, read_only_transaction])
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ValueError("Test error"),
+            HTTPException(status_code=400, detail="Bad request"),
+            SQLAlchemyError("Database error"),
+            Exception("Read operation failed"),
+        ],
+    )
+    async def test_rollback_reraises_original_exception(self, mock_db_with_tx, decorator, error):
+        """Test that the exception propagates unchanged through the transaction context."""
+        mock_db, mock_transaction = mock_db_with_tx
+
+        @decorator()
+        async def test_function(db: AsyncSession):
+            raise error
+
+        with pytest.raises(type(error)) as exc_info:
+            await test_function(db=mock_db)
+
+        assert exc_info.value is error
+        mock_db.begin.assert_called_once()
+        mock_transaction.__aenter__.assert_called_once()
+        mock_transaction.__aexit__.assert_called_once()
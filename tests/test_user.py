@@ -4,9 +4,10 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from src.app.api.v1.users import erase_user, patch_user, read_user, read_users, write_user
+from src.app.api.v1.users import erase_user, grant_user_roles, patch_user, read_user, read_users, write_user
 from src.app.core.exceptions.http_exceptions import DuplicateValueException, ForbiddenException, NotFoundException
-from src.app.schemas.user import UserCreate, UserRead, UserUpdate
+from src.app.core.utils.cache import invalidate_cached_permissions
+from src.app.schemas.user import UserCreate, UserRead, UserRolesAssign, UserUpdate
 
 
 class TestWriteUser:
@@ -17,11 +18,11 @@ class TestWriteUser:
         """Test successful user creation."""
         user_create = UserCreate(**sample_user_data)
 
+        # Mock that email and username don't exist
+        mock_db.execute.return_value = Mock(all=Mock(return_value=[]))
+
         with patch("src.app.api.v1.users.crud_users") as mock_crud:
-            # Mock that email and username don't exist
-            mock_crud.exists = AsyncMock(side_effect=[False, False])  # email, then username
-            mock_crud.create = AsyncMock(return_value=Mock(id=1))
-            mock_crud.get = AsyncMock(return_value=sample_user_read)
+            mock_crud.create = AsyncMock(return_value=sample_user_read)
 
             with patch("src.app.api.v1.users.get_password_hash") as mock_hash:
                 mock_hash.return_value = "hashed_password"
@@ -29,33 +30,32 @@ class TestWriteUser:
                 result = await write_user(Mock(), user_create, mock_db)
 
                 assert result == sample_user_read
-                mock_crud.exists.assert_any_call(db=mock_db, email=user_create.email)
-                mock_crud.exists.assert_any_call(db=mock_db, username=user_create.username)
+                # Email and username are checked in a single query
+                mock_db.execute.assert_called_once()
                 mock_crud.create.assert_called_once()
+                mock_crud.get.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_create_user_duplicate_email(self, mock_db, sample_user_data):
         """Test user creation with duplicate email."""
         user_create = UserCreate(**sample_user_data)
 
-        with patch("src.app.api.v1.users.crud_users") as mock_crud:
-            # Mock that email already exists
-            mock_crud.exists = AsyncMock(return_value=True)
+        # Mock that email already exists
+        mock_db.execute.return_value = Mock(all=Mock(return_value=[(user_create.email, "otheruser")]))
 
-            with pytest.raises(DuplicateValueException, match="Email is already registered"):
-                await write_user(Mock(), user_create, mock_db)
+        with pytest.raises(DuplicateValueException, match="Email is already registered"):
+            await write_user(Mock(), user_create, mock_db)
 
     @pytest.mark.asyncio
     async def test_create_user_duplicate_username(self, mock_db, sample_user_data):
         """Test user creation with duplicate username."""
         user_create = UserCreate(**sample_user_data)
 
-        with patch("src.app.api.v1.users.crud_users") as mock_crud:
-            # Mock email doesn't exist, but username does
-            mock_crud.exists = AsyncMock(side_effect=[False, True])
+        # Mock email doesn't exist, but username does
+        mock_db.execute.return_value = Mock(all=Mock(return_value=[("other@example.com", user_create.username)]))
 
-            with pytest.raises(DuplicateValueException, match="Username not available"):
-                await write_user(Mock(), user_create, mock_db)
+        with pytest.raises(DuplicateValueException, match="Username not available"):
+            await write_user(Mock(), user_create, mock_db)
 
 
 class TestReadUser:
@@ -94,20 +94,17 @@ class TestReadUsers:
     @pytest.mark.asyncio
     async def test_read_users_success(self, mock_db):
         """Test successful users list retrieval."""
-        mock_users_data = {"data": [{"id": 1}, {"id": 2}], "count": 2}
+        mock_users_data = {"data": [{"id": 3}, {"id": 4}], "next_cursor": 4}
 
         with patch("src.app.api.v1.users.crud_users") as mock_crud:
-            mock_crud.get_multi = AsyncMock(return_value=mock_users_data)
+            mock_crud.get_multi_by_cursor = AsyncMock(return_value=mock_users_data)
 
-            with patch("src.app.api.v1.users.paginated_response") as mock_paginated:
-                expected_response = {"data": [{"id": 1}, {"id": 2}], "pagination": {}}
-                mock_paginated.return_value = expected_response
+            result = await read_users(Mock(), mock_db, after_id=2, limit=2)
 
-                result = await read_users(Mock(), mock_db, page=1, items_per_page=10)
-
-                assert result == expected_response
-                mock_crud.get_multi.assert_called_once()
-                mock_paginated.assert_called_once()
+            assert result == mock_users_data
+            mock_crud.get_multi_by_cursor.assert_called_once_with(
+                db=mock_db, cursor=2, limit=2, schema_to_select=UserRead, sort_column="id", is_deleted=False
+            )
 
 
 class TestPatchUser:
@@ -148,6 +145,24 @@ class TestPatchUser:
                 await patch_user(Mock(), user_update, username, current_user_dict, mock_db)
 
 
+    @pytest.mark.asyncio
+    async def test_patch_user_unchanged_values_skip_duplicate_check(self, mock_db, current_user_dict, sample_user_read):
+        """Test that unchanged username/email don't trigger a duplicate lookup."""
+        user_dict = sample_user_read.model_dump()
+        user_dict.update(username="userson", email="user.userson@example.com")
+        user_update = UserUpdate(username="userson", email="user.userson@example.com")
+
+        with patch("src.app.api.v1.users.crud_users") as mock_crud:
+            mock_crud.get = AsyncMock(return_value=user_dict)
+            mock_crud.update = AsyncMock(return_value=sample_user_read)
+
+            result = await patch_user(1, user_update, current_user_dict, mock_db)
+
+            assert result == sample_user_read
+            mock_db.execute.assert_not_called()
+            mock_crud.update.assert_called_once()
+
+
 class TestEraseUser:
     """Test user deletion endpoint."""
 
@@ -193,3 +208,38 @@ class TestEraseUser:
 
             with pytest.raises(ForbiddenException):
                 await erase_user(Mock(), username, current_user_dict, mock_db, token)
+
+
+class TestGrantUserRoles:
+    """Test user role assignment endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_grant_user_roles_success(self, mock_db, sample_user_read):
+        """Test that all role ids are validated with a single query."""
+        mock_db.execute.return_value = Mock(scalars=Mock(return_value=Mock(all=Mock(return_value=[1, 2]))))
+
+        with patch("src.app.api.v1.users.crud_users") as mock_crud:
+            mock_crud.get = AsyncMock(return_value=sample_user_read)
+
+            with (
+                patch("src.app.api.v1.users.assign_role_to_user", new_callable=AsyncMock) as mock_assign,
+                patch("src.app.api.v1.users.run_after_commit") as mock_after_commit,
+            ):
+                result = await grant_user_roles(1, UserRolesAssign(role_ids=[1, 2]), mock_db)
+
+                assert result == {"user_id": 1, "role_ids": [1, 2]}
+                mock_db.execute.assert_called_once()
+                mock_assign.assert_called_once_with(mock_db, 1, [1, 2])
+                # The cached permissions are dropped only once the new roles are committed
+                mock_after_commit.assert_called_once_with(mock_db, invalidate_cached_permissions, 1)
+
+    @pytest.mark.asyncio
+    async def test_grant_user_roles_missing_role(self, mock_db, sample_user_read):
+        """Test role assignment when some role ids don't exist."""
+        mock_db.execute.return_value = Mock(scalars=Mock(return_value=Mock(all=Mock(return_value=[1]))))
+
+        with patch("src.app.api.v1.users.crud_users") as mock_crud:
+            mock_crud.get = AsyncMock(return_value=sample_user_read)
+
+            with pytest.raises(NotFoundException, match="Role not found: 2, 3"):
+                await grant_user_roles(1, UserRolesAssign(role_ids=[1, 2, 3]), mock_db)